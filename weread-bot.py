@@ -42,28 +42,75 @@ import re
 import json
 import time
 import random
+import math
+import statistics
+import functools
+import itertools
+import operator
 import hashlib
+import pickle
+import http.cookiejar
 import logging
 import asyncio
-import urllib.parse
 import signal
+import threading
+import sys
 import argparse
+import platform
+import queue
+import atexit
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
-from dataclasses import dataclass, field
+from collections import deque
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+from urllib.parse import quote
 
 import yaml
 import requests
-import schedule
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+# 可选依赖：安装 orjson 后使用其加速JSON解析
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError 是 json.JSONDecodeError 的子类，异常处理保持不变
+json_loads = orjson.loads if orjson else json.loads
+
+
+def json_dumps(obj: Any) -> bytes:
+    """序列化为紧凑的JSON字节串"""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+# 优先使用 libyaml 提供的C加速加载器
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 VERSION = "0.2.9"
 REPO = "https://github.com/funnyzak/weread-bot"
 
+# 运行环境信息（进程内不变，只获取一次）
+PYTHON_VERSION = platform.python_version()
+SYSTEM_INFO = f"{platform.system()} {platform.release()}"
+
+# 高频创建的数据类在 Python 3.10+ 上启用 __slots__，减少内存占用
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# 环境变量占位符，如 ${PUSHPLUS_TOKEN}
+ENV_PLACEHOLDER_PATTERN = re.compile(r'\$\{([^}]+)\}')
+
+# 请求签名哈希（非安全用途，跳过 OpenSSL 的安全策略检查）
+_sha256 = functools.partial(hashlib.sha256, usedforsecurity=False)
+
 
 class NotificationMethod(Enum):
     """通知方式枚举"""
@@ -102,14 +149,14 @@ class NetworkConfig:
     rate_limit: int = 10
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ChapterInfo:
     """章节信息"""
     chapter_id: str
     chapter_index: Optional[int] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BookInfo:
     """书籍信息"""
     name: str
@@ -140,6 +187,8 @@ class DaemonConfig:
     enabled: bool = False
     session_interval: str = "120-180"  # 会话间隔（分钟）
     max_daily_sessions: int = 12  # 每日最大会话数
+    min_interval: int = 0  # 自适应间隔下限（分钟），0 表示使用会话间隔下限
+    max_interval: int = 0  # 自适应间隔上限（分钟），0 表示使用会话间隔上限的2倍
 
 
 @dataclass
@@ -151,6 +200,7 @@ class LoggingConfig:
     max_size: str = "10MB"
     backup_count: int = 5
     console: bool = True
+    use_async_handler: bool = True  # 通过后台线程写日志，避免阻塞主流程
 
 
 @dataclass
@@ -184,7 +234,7 @@ class UserConfig:
     reading_overrides: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class NotificationChannel:
     """通知通道配置"""
     name: str
@@ -197,6 +247,7 @@ class NotificationConfig:
     """通知配置"""
     enabled: bool = True
     include_statistics: bool = True
+    send_per_user_errors: bool = False  # 多用户模式下是否逐个发送用户错误通知
     channels: List[NotificationChannel] = field(default_factory=list)
 
 
@@ -215,6 +266,7 @@ class WeReadConfig:
 
     # 多用户配置
     users: List[UserConfig] = field(default_factory=list)
+    max_concurrent_users: int = 1  # 多用户模式下同时运行的会话数
 
     # 各模块配置
     reading: ReadingConfig = field(default_factory=ReadingConfig)
@@ -231,55 +283,64 @@ class WeReadConfig:
 
     def get_startup_info(self) -> str:
         """获取启动信息摘要"""
-        # 获取系统信息
-        import platform
+        # 预先计算各项统计，避免在格式化时重复遍历
+        enabled_channels = sum(
+            1 for c in self.notification.channels if c.enabled
+        )
+        users_count = len(self.users)
+        user_mode = '(多用户模式)' if self.users else '(单用户模式)'
+        books_count = len(self.reading.books)
 
         # 构建启动信息
-        startup_info = f"""
-📚 微信读书阅读机器人
-
-应用信息:
-  📱 应用名称: {self.name}
-  🔢 版本: {self.version}
-  📦 仓库: {REPO}
-  🐍 Python版本: {platform.python_version()}
-  🖥️  系统: {platform.system()} {platform.release()}
-  📁 工作目录: {Path.cwd()}
-
-运行配置:
-  🚀 启动模式: {self._get_startup_mode_desc()}
-  ⏰ 启动延迟: {self.startup_delay} 秒
-  📖 阅读模式: {self._get_reading_mode_desc()}
-  📊 目标时长: {self.reading.target_duration} 分钟
-  🔄 阅读间隔: {self.reading.reading_interval} 秒
-  🎭 人类模拟: {'启用' if self.human_simulation.enabled else '禁用'}
-
-网络配置:
-  ⏱️  超时时间: {self.network.timeout} 秒
-  🔄 重试次数: {self.network.retry_times} 次
-  📈 请求限制: {self.network.rate_limit} 请求/分钟
-  🕐 重试延迟: {self.network.retry_delay} 秒
-
-通知配置:
-  📢 通知状态: {'启用' if self.notification.enabled else '禁用'}
-  📨 通知通道: {len([c for c in self.notification.channels if c.enabled])} 个启用
-  📊 统计信息: {'包含' if self.notification.include_statistics else '不包含'}
-
-数据源配置:
-  📄 CURL文件: {self._get_curl_source_desc()}
-  👥 用户配置: {len(self.users)} 个用户 {'(多用户模式)' if self.users else '(单用户模式)'}
-  📚 配置书籍: {len(self.reading.books)} 本
-  🎯 优先策略: {'CURL数据优先' if self.reading.use_curl_data_first else '配置数据优先'}
-  🔄 回退策略: {'启用' if self.reading.fallback_to_config else '禁用'}
-
-日志配置:
-  📝 日志级别: {self.logging.level}
-  📋 日志格式: {self.logging.format}
-  💾 日志文件: {self.logging.file}
-  📏 文件大小: {self.logging.max_size}
-  🗂️  备份数量: {self.logging.backup_count} 个
-  🖥️  控制台: {'启用' if self.logging.console else '禁用'}
-"""
+        lines = [
+            "",
+            "📚 微信读书阅读机器人",
+            "",
+            "应用信息:",
+            f"  📱 应用名称: {self.name}",
+            f"  🔢 版本: {self.version}",
+            f"  📦 仓库: {REPO}",
+            f"  🐍 Python版本: {PYTHON_VERSION}",
+            f"  🖥️  系统: {SYSTEM_INFO}",
+            f"  📁 工作目录: {Path.cwd()}",
+            "",
+            "运行配置:",
+            f"  🚀 启动模式: {self._get_startup_mode_desc()}",
+            f"  ⏰ 启动延迟: {self.startup_delay} 秒",
+            f"  📖 阅读模式: {self._get_reading_mode_desc()}",
+            f"  📊 目标时长: {self.reading.target_duration} 分钟",
+            f"  🔄 阅读间隔: {self.reading.reading_interval} 秒",
+            f"  🎭 人类模拟: {'启用' if self.human_simulation.enabled else '禁用'}",
+            "",
+            "网络配置:",
+            f"  ⏱️  超时时间: {self.network.timeout} 秒",
+            f"  🔄 重试次数: {self.network.retry_times} 次",
+            f"  📈 请求限制: {self.network.rate_limit} 请求/分钟",
+            f"  🕐 重试延迟: {self.network.retry_delay} 秒",
+            "",
+            "通知配置:",
+            f"  📢 通知状态: {'启用' if self.notification.enabled else '禁用'}",
+            f"  📨 通知通道: {enabled_channels} 个启用",
+            f"  📊 统计信息: {'包含' if self.notification.include_statistics else '不包含'}",
+            f"  🧾 用户错误: {'逐个发送' if self.notification.send_per_user_errors else '汇总发送'}",
+            "",
+            "数据源配置:",
+            f"  📄 CURL文件: {self._get_curl_source_desc()}",
+            f"  👥 用户配置: {users_count} 个用户 {user_mode}",
+            f"  📚 配置书籍: {books_count} 本",
+            f"  🎯 优先策略: {'CURL数据优先' if self.reading.use_curl_data_first else '配置数据优先'}",
+            f"  🔄 回退策略: {'启用' if self.reading.fallback_to_config else '禁用'}",
+            "",
+            "日志配置:",
+            f"  📝 日志级别: {self.logging.level}",
+            f"  📋 日志格式: {self.logging.format}",
+            f"  💾 日志文件: {self.logging.file}",
+            f"  📏 文件大小: {self.logging.max_size}",
+            f"  🗂️  备份数量: {self.logging.backup_count} 个",
+            f"  🖥️  控制台: {'启用' if self.logging.console else '禁用'}",
+            "",
+        ]
+        startup_info = "\n".join(lines)
 
         # 如果是定时或守护进程模式，添加额外信息
         if self.startup_mode.lower() == "scheduled" and self.schedule.enabled:
@@ -324,9 +385,12 @@ class WeReadConfig:
             return "未配置"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ReadingSession:
     """阅读会话统计"""
+
+    RESPONSE_SAMPLE_SIZE = 256  # 响应时间抽样容量，用于估算分位数
+
     user_name: str = "默认用户"
     start_time: datetime = field(default_factory=datetime.now)
     end_time: Optional[datetime] = None
@@ -334,20 +398,79 @@ class ReadingSession:
     actual_duration_seconds: int = 0
     successful_reads: int = 0
     failed_reads: int = 0
-    books_read: List[str] = field(default_factory=list)  # 存储书籍ID
+    books_read: List[str] = field(default_factory=list)  # 存储书籍ID（去重，按首次阅读顺序）
     books_read_names: List[str] = field(default_factory=list)  # 存储书名
     chapters_read: List[str] = field(default_factory=list)
+    # 与上面列表对应的去重集合，用于 O(1) 成员判断
+    unique_books: set = field(default_factory=set, repr=False)
+    unique_book_names: set = field(default_factory=set, repr=False)
+    unique_chapters: set = field(default_factory=set, repr=False)
     breaks_taken: int = 0
     total_break_time: int = 0
-    response_times: List[float] = field(default_factory=list)
+    # 响应时间按流式累计，抽样列表容量固定，长时间运行不再持续增长
+    response_samples: List[float] = field(default_factory=list, repr=False)
+    _response_time_sum: float = field(default=0.0, init=False, repr=False)
+    _response_time_sq_sum: float = field(default=0.0, init=False, repr=False)
+    _response_time_max: float = field(default=0.0, init=False, repr=False)
+    _response_time_count: int = field(default=0, init=False, repr=False)
+
+    def add_read(self, book_id: str, book_name: str, chapter_id: str):
+        """记录一次阅读的书籍和章节"""
+        if book_id not in self.unique_books:
+            book_id = sys.intern(book_id)
+            self.unique_books.add(book_id)
+            self.books_read.append(book_id)
+        if book_name not in self.unique_book_names:
+            self.unique_book_names.add(book_name)
+            self.books_read_names.append(book_name)
+        if chapter_id not in self.unique_chapters:
+            self.unique_chapters.add(chapter_id)
+            self.chapters_read.append(chapter_id)
+
+    def record_response(self, response_time: float):
+        """记录一次响应时间"""
+        self._response_time_count += 1
+        self._response_time_sum += response_time
+        self._response_time_sq_sum += response_time * response_time
+        if response_time > self._response_time_max:
+            self._response_time_max = response_time
+
+        # 水塘抽样：样本在整个会话内保持均匀分布
+        if len(self.response_samples) < self.RESPONSE_SAMPLE_SIZE:
+            self.response_samples.append(response_time)
+        else:
+            index = random.randrange(self._response_time_count)
+            if index < self.RESPONSE_SAMPLE_SIZE:
+                self.response_samples[index] = response_time
 
     @property
     def average_response_time(self) -> float:
         """计算平均响应时间"""
-        if self.response_times:
-            return sum(self.response_times) / len(self.response_times)
+        if self._response_time_count:
+            return self._response_time_sum / self._response_time_count
         return 0.0
 
+    @property
+    def max_response_time(self) -> float:
+        """最大响应时间"""
+        return self._response_time_max
+
+    @property
+    def response_time_stddev(self) -> float:
+        """响应时间标准差"""
+        if not self._response_time_count:
+            return 0.0
+        mean = self.average_response_time
+        variance = self._response_time_sq_sum / self._response_time_count - mean * mean
+        return math.sqrt(max(0.0, variance))
+
+    @property
+    def response_time_p95(self) -> float:
+        """基于抽样估算的响应时间 P95"""
+        if len(self.response_samples) < 2:
+            return self.response_samples[0] if self.response_samples else 0.0
+        return statistics.quantiles(self.response_samples, n=20)[-1]
+
     @property
     def success_rate(self) -> float:
         """计算成功率"""
@@ -364,7 +487,7 @@ class ReadingSession:
     def get_statistics_summary(self) -> str:
         """获取统计摘要"""
         books_info = (
-            ', '.join(set(self.books_read_names))
+            ', '.join(self.books_read_names)
             if self.books_read_names else '无书名信息'
         )
         return f"""📊 微信读书自动阅读统计报告
@@ -375,8 +498,8 @@ class ReadingSession:
 ✅ 成功请求: {self.successful_reads}次
 ❌ 失败请求: {self.failed_reads}次
 📈 成功率: {self.success_rate:.1f}%
-📚 阅读书籍: {len(set(self.books_read))}本 ({books_info})
-📄 阅读章节: {len(set(self.chapters_read))}个
+📚 阅读书籍: {len(self.unique_books)}本 ({books_info})
+📄 阅读章节: {len(self.unique_chapters)}个
 ☕ 休息次数: {self.breaks_taken}次 (共{self.total_break_time}秒)
 🚀 平均响应: {self.average_response_time:.2f}秒
 
@@ -386,51 +509,115 @@ class ReadingSession:
 class ConfigManager:
     """配置管理器"""
 
+    # 通知通道环境变量映射: 通道名 -> [(配置键, 环境变量名, 是否必需)]
+    CHANNEL_ENV_MAP = {
+        "pushplus": [("token", "PUSHPLUS_TOKEN", True)],
+        "telegram": [
+            ("bot_token", "TELEGRAM_BOT_TOKEN", True),
+            ("chat_id", "TELEGRAM_CHAT_ID", True),
+        ],
+        "wxpusher": [("spt", "WXPUSHER_SPT", True)],
+        "apprise": [("url", "APPRISE_URL", True)],
+        "bark": [
+            ("server", "BARK_SERVER", True),
+            ("device_key", "BARK_DEVICE_KEY", True),
+            ("sound", "BARK_SOUND", False),
+        ],
+        "ntfy": [
+            ("server", "NTFY_SERVER", True),
+            ("topic", "NTFY_TOPIC", True),
+            ("token", "NTFY_TOKEN", False),
+        ],
+        "feishu": [
+            ("webhook_url", "FEISHU_WEBHOOK_URL", True),
+            ("msg_type", "FEISHU_MSG_TYPE", False),
+        ],
+        "wework": [
+            ("webhook_url", "WEWORK_WEBHOOK_URL", True),
+            ("msg_type", "WEWORK_MSG_TYPE", False),
+        ],
+        "dingtalk": [
+            ("webhook_url", "DINGTALK_WEBHOOK_URL", True),
+            ("msg_type", "DINGTALK_MSG_TYPE", False),
+        ],
+        "gotify": [
+            ("server", "GOTIFY_SERVER", True),
+            ("token", "GOTIFY_TOKEN", True),
+            ("priority", "GOTIFY_PRIORITY", False),
+            ("title", "GOTIFY_TITLE", False),
+        ],
+    }
+    # 需要转换为整数的通道配置项
+    CHANNEL_ENV_INT_KEYS = {"priority"}
+
     def __init__(self, config_path: str = "config.yaml"):
         self.config_path = config_path
+        self._env: Dict[str, str] = {}
+        self._config_data: dict = {}
+        self._flat_config: Dict[str, Any] = {}
+        self._has_placeholders = False
         self.config = self._load_config()
 
     def _load_config(self) -> WeReadConfig:
         """加载配置文件"""
         config_data = {}
+        # 每次加载时对环境变量做一次快照，后续只做字典查找
+        self._env = dict(os.environ)
+        self._has_placeholders = False
 
         # 尝试加载YAML配置文件
         if Path(self.config_path).exists():
             try:
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    config_data = yaml.safe_load(f) or {}
+                with open(self.config_path, 'rb') as f:
+                    raw_bytes = f.read()
+                raw_text = raw_bytes.decode('utf-8')
+                # 文件中没有占位符时，跳过YAML值的占位符解析
+                self._has_placeholders = '${' in raw_text
+                config_data = self._parse_yaml(raw_bytes, raw_text)
                 logging.info(f"✅ 已加载配置文件: {self.config_path}")
             except Exception as e:
                 logging.warning(f"⚠️ 配置文件加载失败: {e}")
 
+        if not isinstance(config_data, dict):
+            logging.warning("⚠️ 配置文件顶层不是字典结构，已忽略")
+            config_data = {}
+
+        # 将嵌套配置展开为 {"reading.mode": value} 形式的查找表
+        self._config_data = config_data
+        self._flat_config = dict(self._flatten_config(config_data))
+
         # 从环境变量获取配置（优先级最高）
         config = WeReadConfig(
-            startup_mode=self._get_config_value(
+            startup_mode=self._get_str(
                 config_data, "app.startup_mode", "STARTUP_MODE", "immediate"
             ),
-            startup_delay=self._get_config_value(
+            startup_delay=self._get_str(
                 config_data, "app.startup_delay", "STARTUP_DELAY", "1-10"
             ),
-            curl_file_path=self._get_config_value(
+            curl_file_path=self._get_str(
                 config_data, "curl_config.file_path",
                 "WEREAD_CURL_BASH_FILE_PATH", ""
             ),
-            curl_content=self._get_config_value(
+            curl_content=self._get_str(
                 config_data, "curl_config.content", "WEREAD_CURL_STRING", ""
             ),
             users=self._load_user_configs(config_data),
+            max_concurrent_users=self._get_int(
+                config_data, "app.max_concurrent_users",
+                "MAX_CONCURRENT_USERS", 1
+            ),
         )
 
         # 加载阅读配置
         config.reading = ReadingConfig(
-            mode=self._get_config_value(
+            mode=self._get_str(
                 config_data, "reading.mode", "READING_MODE", "smart_random"
             ),
-            target_duration=self._get_config_value(
+            target_duration=self._get_str(
                 config_data, "reading.target_duration",
                 "TARGET_DURATION", "60-70"
             ),
-            reading_interval=self._get_config_value(
+            reading_interval=self._get_str(
                 config_data, "reading.reading_interval",
                 "READING_INTERVAL", "25-35"
             ),
@@ -444,35 +631,35 @@ class ConfigManager:
             ),
             books=self._load_books(config_data),
             smart_random=SmartRandomConfig(
-                book_continuity=float(self._get_config_value(
+                book_continuity=self._get_float(
                     config_data, "reading.smart_random.book_continuity",
-                    "BOOK_CONTINUITY", "0.8"
-                )),
-                chapter_continuity=float(self._get_config_value(
+                    "BOOK_CONTINUITY", 0.8
+                ),
+                chapter_continuity=self._get_float(
                     config_data, "reading.smart_random.chapter_continuity",
-                    "CHAPTER_CONTINUITY", "0.7"
-                )),
-                book_switch_cooldown=int(self._get_config_value(
+                    "CHAPTER_CONTINUITY", 0.7
+                ),
+                book_switch_cooldown=self._get_int(
                     config_data, "reading.smart_random.book_switch_cooldown",
-                    "BOOK_SWITCH_COOLDOWN", "300"
-                )),
+                    "BOOK_SWITCH_COOLDOWN", 300
+                ),
             ),
         )
 
         # 加载网络配置
         config.network = NetworkConfig(
-            timeout=int(self._get_config_value(
-                config_data, "network.timeout", "NETWORK_TIMEOUT", "30"
-            )),
-            retry_times=int(self._get_config_value(
-                config_data, "network.retry_times", "RETRY_TIMES", "3"
-            )),
-            retry_delay=self._get_config_value(
+            timeout=self._get_int(
+                config_data, "network.timeout", "NETWORK_TIMEOUT", 30
+            ),
+            retry_times=self._get_int(
+                config_data, "network.retry_times", "RETRY_TIMES", 3
+            ),
+            retry_delay=self._get_str(
                 config_data, "network.retry_delay", "RETRY_DELAY", "5-15"
             ),
-            rate_limit=int(self._get_config_value(
-                config_data, "network.rate_limit", "RATE_LIMIT", "10"
-            )),
+            rate_limit=self._get_int(
+                config_data, "network.rate_limit", "RATE_LIMIT", 10
+            ),
         )
 
         # 加载人类行为模拟配置
@@ -485,11 +672,11 @@ class ConfigManager:
                 config_data, "human_simulation.reading_speed_variation",
                 "READING_SPEED_VARIATION", True
             ),
-            break_probability=float(self._get_config_value(
+            break_probability=self._get_float(
                 config_data, "human_simulation.break_probability",
-                "BREAK_PROBABILITY", "0.1"
-            )),
-            break_duration=self._get_config_value(
+                "BREAK_PROBABILITY", 0.1
+            ),
+            break_duration=self._get_str(
                 config_data, "human_simulation.break_duration",
                 "BREAK_DURATION", "10-20"
             ),
@@ -509,6 +696,10 @@ class ConfigManager:
                 config_data, "notification.include_statistics",
                 "INCLUDE_STATISTICS", True
             ),
+            send_per_user_errors=self._get_bool_config(
+                config_data, "notification.send_per_user_errors",
+                "SEND_PER_USER_ERRORS", False
+            ),
             channels=self._load_notification_channels(config_data),
         )
 
@@ -517,11 +708,11 @@ class ConfigManager:
             enabled=self._get_bool_config(
                 config_data, "schedule.enabled", "SCHEDULE_ENABLED", False
             ),
-            cron_expression=self._get_config_value(
+            cron_expression=self._get_str(
                 config_data, "schedule.cron_expression",
                 "CRON_EXPRESSION", "0 */2 * * *"
             ),
-            timezone=self._get_config_value(
+            timezone=self._get_str(
                 config_data, "schedule.timezone", "TIMEZONE", "Asia/Shanghai"
             ),
         )
@@ -531,90 +722,160 @@ class ConfigManager:
             enabled=self._get_bool_config(
                 config_data, "daemon.enabled", "DAEMON_ENABLED", False
             ),
-            session_interval=self._get_config_value(
+            session_interval=self._get_str(
                 config_data, "daemon.session_interval",
                 "SESSION_INTERVAL", "120-180"
             ),
-            max_daily_sessions=int(self._get_config_value(
+            max_daily_sessions=self._get_int(
                 config_data, "daemon.max_daily_sessions",
-                "MAX_DAILY_SESSIONS", "12"
-            )),
+                "MAX_DAILY_SESSIONS", 12
+            ),
+            min_interval=self._get_int(
+                config_data, "daemon.min_interval",
+                "DAEMON_MIN_INTERVAL", 0
+            ),
+            max_interval=self._get_int(
+                config_data, "daemon.max_interval",
+                "DAEMON_MAX_INTERVAL", 0
+            ),
         )
 
         # 加载日志配置
         config.logging = LoggingConfig(
-            level=self._get_config_value(
+            level=self._get_str(
                 config_data, "logging.level", "LOG_LEVEL", "INFO"
             ),
-            format=self._get_config_value(
+            format=self._get_str(
                 config_data, "logging.format", "LOG_FORMAT", "detailed"
             ),
-            file=self._get_config_value(
+            file=self._get_str(
                 config_data, "logging.file", "LOG_FILE", "logs/weread.log"
             ),
-            max_size=self._get_config_value(
+            max_size=self._get_str(
                 config_data, "logging.max_size", "LOG_MAX_SIZE", "10MB"
             ),
-            backup_count=int(self._get_config_value(
-                config_data, "logging.backup_count", "LOG_BACKUP_COUNT", "5"
-            )),
+            backup_count=self._get_int(
+                config_data, "logging.backup_count", "LOG_BACKUP_COUNT", 5
+            ),
             console=self._get_bool_config(
                 config_data, "logging.console", "LOG_CONSOLE", True
             ),
+            use_async_handler=self._get_bool_config(
+                config_data, "logging.use_async_handler",
+                "LOG_ASYNC_HANDLER", True
+            ),
         )
 
         return config
 
+    def _parse_yaml(self, raw_bytes: bytes, raw_text: str) -> dict:
+        """解析YAML配置内容
+
+        设置环境变量 WEREAD_CONFIG_CACHE=1 后，解析结果会以内容哈希为键
+        缓存到配置文件旁的 <配置名>.<哈希>.pkl 文件中。只缓存YAML解析结果，
+        环境变量覆盖仍在每次加载时重新计算。
+        """
+        if self._getenv("WEREAD_CONFIG_CACHE") != "1":
+            return yaml.load(raw_text, Loader=YamlLoader) or {}
+
+        config_file = Path(self.config_path)
+        digest = hashlib.blake2b(raw_bytes, digest_size=16).hexdigest()
+        cache_file = config_file.with_name(
+            f"{config_file.stem}.{digest}.pkl"
+        )
+
+        if cache_file.exists():
+            try:
+                with open(cache_file, 'rb') as f:
+                    config_data = pickle.load(f)
+                if isinstance(config_data, dict):
+                    logging.debug(f"📦 使用配置解析缓存: {cache_file}")
+                    return config_data
+            except Exception as e:
+                logging.warning(f"⚠️ 配置缓存读取失败，重新解析: {e}")
+
+        config_data = yaml.load(raw_text, Loader=YamlLoader) or {}
+
+        try:
+            # 清理旧内容对应的缓存文件，只匹配 <配置名>.<32位哈希>.pkl，不误删其他文件
+            stale_pattern = re.compile(
+                rf"{re.escape(config_file.stem)}\.[0-9a-f]{{32}}\.pkl"
+            )
+            for stale_file in config_file.parent.glob(
+                f"{config_file.stem}.*.pkl"
+            ):
+                if (stale_file != cache_file
+                        and stale_pattern.fullmatch(stale_file.name)):
+                    stale_file.unlink()
+            with open(cache_file, 'wb') as f:
+                pickle.dump(config_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logging.warning(f"⚠️ 配置缓存写入失败: {e}")
+
+        return config_data
+
     def _load_books(self, config_data: dict) -> List[BookInfo]:
         """加载书籍配置"""
         books = []
 
         # 从YAML配置加载
-        books_config = self._get_nested_dict_value(
-            config_data, "reading.books"
+        reading_data = config_data.get("reading")
+        books_config = (
+            reading_data.get("books") if isinstance(reading_data, dict)
+            else None
         )
         if books_config and isinstance(books_config, list):
             for book_data in books_config:
-                if isinstance(book_data, dict):
+                try:
                     name = book_data.get("name", "")
                     book_id = book_data.get("book_id", "")
                     chapters_config = book_data.get("chapters", [])
-                    
-                    if name and book_id and isinstance(chapters_config, list):
-                        # 处理章节配置，支持两种格式
-                        chapters = []
-                        chapter_infos = []
-                        
-                        for chapter_item in chapters_config:
-                            if isinstance(chapter_item, str):
-                                # 格式：只有章节ID字符串
-                                chapters.append(chapter_item)
-                                chapter_infos.append(ChapterInfo(chapter_id=chapter_item))
-                            elif isinstance(chapter_item, dict):
-                                # 格式：包含章节ID和可选的索引
-                                chapter_id = chapter_item.get("chapter_id") or chapter_item.get("id")
-                                chapter_index = chapter_item.get("chapter_index") or chapter_item.get("index")
-                                
-                                if chapter_id:
-                                    chapters.append(chapter_id)  # 保持向后兼容
-                                    chapter_infos.append(ChapterInfo(
-                                        chapter_id=chapter_id,
-                                        chapter_index=chapter_index
-                                    ))
-                        
-                        if chapters:
-                            books.append(BookInfo(
-                                name=name,
-                                book_id=book_id,
-                                chapters=chapters,
-                                chapter_infos=chapter_infos
-                            ))
-                        logging.info(
-                            f"✅ 已加载书籍配置: {name} ({book_id}), "
-                            f"章节数: {len(chapters)}"
-                        )
-                    else:
-                        logging.warning(f"⚠️ 跳过无效的书籍配置: {book_data}")
+                except AttributeError:
+                    # 非字典格式的书籍配置直接跳过
+                    continue
+
+                if name and book_id and isinstance(chapters_config, list):
+                    if isinstance(book_id, str):
+                        # 书籍ID会在阅读记录中反复出现，驻留以复用同一字符串
+                        book_id = sys.intern(book_id)
+
+                    # 处理章节配置，支持两种格式
+                    chapters = []
+                    chapter_infos = []
+
+                    for chapter_item in chapters_config:
+                        if isinstance(chapter_item, str):
+                            # 格式：只有章节ID字符串
+                            chapter_item = sys.intern(chapter_item)
+                            chapters.append(chapter_item)
+                            chapter_infos.append(ChapterInfo(chapter_id=chapter_item))
+                        elif isinstance(chapter_item, dict):
+                            # 格式：包含章节ID和可选的索引
+                            chapter_id = chapter_item.get("chapter_id") or chapter_item.get("id")
+                            chapter_index = chapter_item.get("chapter_index") or chapter_item.get("index")
+
+                            if isinstance(chapter_id, str):
+                                chapter_id = sys.intern(chapter_id)
+                            if chapter_id:
+                                chapters.append(chapter_id)  # 保持向后兼容
+                                chapter_infos.append(ChapterInfo(
+                                    chapter_id=chapter_id,
+                                    chapter_index=chapter_index
+                                ))
+
+                    if chapters:
+                        books.append(BookInfo(
+                            name=name,
+                            book_id=book_id,
+                            chapters=chapters,
+                            chapter_infos=chapter_infos
+                        ))
+                    logging.info(
+                        f"✅ 已加载书籍配置: {name} ({book_id}), "
+                        f"章节数: {len(chapters)}"
+                    )
+                else:
+                    logging.warning(f"⚠️ 跳过无效的书籍配置: {book_data}")
 
         # 如果没有配置，则返回空列表
         if not books:
@@ -623,39 +884,63 @@ class ConfigManager:
 
         return books
 
-    def _get_config_value(self, config_data: dict, yaml_path: str,
-                          env_key: str, default: Any) -> Any:
-        """获取配置值，优先级：环境变量 > YAML > 默认值"""
-        # 先检查环境变量
-        env_value = os.getenv(env_key)
+    def _get_str(self, config_data: dict, yaml_path: str,
+                 env_key: str, default: Optional[str]) -> Optional[str]:
+        """获取字符串配置值，优先级：环境变量 > YAML > 默认值"""
+        env_value = self._getenv(env_key)
         if env_value:
-            # 处理环境变量中的占位符
-            env_value = self._resolve_env_placeholders(env_value)
-            return self._parse_config_value(env_value, type(default))
+            return self._resolve_env_placeholders(env_value)
 
-        # 再检查YAML配置
-        yaml_value = self._get_nested_dict_value(config_data, yaml_path)
+        if config_data is self._config_data:
+            yaml_value = self._flat_config.get(yaml_path)
+        else:
+            yaml_value = self._get_nested_dict_value(config_data, yaml_path)
         if yaml_value is not None:
-            yaml_value = self._resolve_env_placeholders(str(yaml_value))
-            return self._parse_config_value(yaml_value, type(default))
+            yaml_value = str(yaml_value)
+            if self._has_placeholders:
+                yaml_value = self._resolve_env_placeholders(yaml_value)
+            return yaml_value
 
         return default
 
+    def _get_int(self, config_data: dict, yaml_path: str,
+                 env_key: str, default: int) -> int:
+        """获取整数配置值"""
+        value = self._get_str(config_data, yaml_path, env_key, None)
+        return default if value is None else int(value)
+
+    def _get_float(self, config_data: dict, yaml_path: str,
+                   env_key: str, default: float) -> float:
+        """获取浮点数配置值"""
+        value = self._get_str(config_data, yaml_path, env_key, None)
+        return default if value is None else float(value)
+
     def _get_bool_config(self, config_data: dict, yaml_path: str,
                          env_key: str, default: bool) -> bool:
         """获取布尔类型配置值"""
-        value = self._get_config_value(
-            config_data, yaml_path, env_key, str(default)
-        )
-        if isinstance(value, bool):
-            return value
-        if isinstance(value, str):
-            return value.lower() in ('true', '1', 'yes', 'on')
-        return default
+        value = self._get_str(config_data, yaml_path, env_key, None)
+        if value is None:
+            return default
+        return value.lower() in ('true', '1', 'yes', 'on')
+
+    @classmethod
+    def _flatten_config(cls, data: dict, prefix: str = ""):
+        """展开嵌套配置，逐层产出 (路径, 值)，中间层字典同样保留"""
+        for key, value in data.items():
+            path = f"{prefix}{key}"
+            yield path, value
+            if isinstance(value, dict):
+                yield from cls._flatten_config(value, f"{path}.")
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _split_config_path(path: str) -> Tuple[str, ...]:
+        """拆分配置路径，如 "reading.mode" -> ("reading", "mode")"""
+        return tuple(path.split('.'))
 
     def _get_nested_dict_value(self, data: dict, path: str) -> Any:
         """从嵌套字典中获取值"""
-        keys = path.split('.')
+        keys = self._split_config_path(path)
         current = data
         for key in keys:
             if isinstance(current, dict) and key in current:
@@ -664,28 +949,21 @@ class ConfigManager:
                 return None
         return current
 
+    def _getenv(self, key: str) -> Optional[str]:
+        """从环境变量快照中读取值"""
+        return self._env.get(key)
+
     def _resolve_env_placeholders(self, value: str) -> str:
         """解析环境变量占位符"""
-        import re
-        pattern = r'\$\{([^}]+)\}'
+        if '${' not in value:
+            return value
 
         def replace_match(match):
             env_var = match.group(1)
-            return os.getenv(env_var, match.group(0))
+            env_value = self._getenv(env_var)
+            return match.group(0) if env_value is None else env_value
 
-        return re.sub(pattern, replace_match, value)
-
-    def _parse_config_value(self, value: str, target_type: type) -> Any:
-        """解析配置值为指定类型"""
-        if target_type == list:
-            if (isinstance(value, str) and
-                    value.startswith('[') and value.endswith(']')):
-                try:
-                    return json.loads(value)
-                except json.JSONDecodeError:
-                    return []
-            return []
-        return value
+        return ENV_PLACEHOLDER_PATTERN.sub(replace_match, value)
 
     def _load_notification_channels(
         self, config_data: dict
@@ -694,8 +972,10 @@ class ConfigManager:
         channels = []
 
         # 从YAML配置加载
-        channels_config = self._get_nested_dict_value(
-            config_data, "notification.channels"
+        notification_data = config_data.get("notification")
+        channels_config = (
+            notification_data.get("channels")
+            if isinstance(notification_data, dict) else None
         )
         if channels_config and isinstance(channels_config, list):
             for channel_data in channels_config:
@@ -721,225 +1001,61 @@ class ConfigManager:
 
         return channels
 
+    def _channel_env_values(self, channel_name: str) -> Dict[str, Any]:
+        """读取通道对应的环境变量，返回已设置的配置项"""
+        values = {}
+        for config_key, env_key, _ in self.CHANNEL_ENV_MAP.get(channel_name, ()):
+            value = self._getenv(env_key)
+            if value:
+                if config_key in self.CHANNEL_ENV_INT_KEYS:
+                    value = int(value)
+                values[config_key] = value
+        return values
+
+    def _apply_env_proxy(self, config: dict):
+        """应用代理环境变量到通道配置"""
+        proxy_config = config.get("proxy", {})
+        if self._getenv("HTTP_PROXY"):
+            proxy_config["http"] = self._getenv("HTTP_PROXY")
+        if self._getenv("HTTPS_PROXY"):
+            proxy_config["https"] = self._getenv("HTTPS_PROXY")
+        if proxy_config:
+            config["proxy"] = proxy_config
+
     def _apply_env_overrides_to_channel(self, channel_name: str,
                                          base_config: dict) -> dict:
         """应用环境变量覆盖到通道配置"""
         config = base_config.copy()
-        
-        if channel_name == "pushplus":
-            if os.getenv("PUSHPLUS_TOKEN"):
-                config["token"] = os.getenv("PUSHPLUS_TOKEN")
-        
-        elif channel_name == "telegram":
-            if os.getenv("TELEGRAM_BOT_TOKEN"):
-                config["bot_token"] = os.getenv("TELEGRAM_BOT_TOKEN")
-            if os.getenv("TELEGRAM_CHAT_ID"):
-                config["chat_id"] = os.getenv("TELEGRAM_CHAT_ID")
-            
-            # 代理配置
-            proxy_config = config.get("proxy", {})
-            if os.getenv("HTTP_PROXY"):
-                proxy_config["http"] = os.getenv("HTTP_PROXY")
-            if os.getenv("HTTPS_PROXY"):
-                proxy_config["https"] = os.getenv("HTTPS_PROXY")
-            if proxy_config:
-                config["proxy"] = proxy_config
-        
-        elif channel_name == "wxpusher":
-            if os.getenv("WXPUSHER_SPT"):
-                config["spt"] = os.getenv("WXPUSHER_SPT")
-        
-        elif channel_name == "apprise":
-            if os.getenv("APPRISE_URL"):
-                config["url"] = os.getenv("APPRISE_URL")
-        
-        elif channel_name == "bark":
-            if os.getenv("BARK_SERVER"):
-                config["server"] = os.getenv("BARK_SERVER")
-            if os.getenv("BARK_DEVICE_KEY"):
-                config["device_key"] = os.getenv("BARK_DEVICE_KEY")
-            if os.getenv("BARK_SOUND"):
-                config["sound"] = os.getenv("BARK_SOUND")
-        
-        elif channel_name == "ntfy":
-            if os.getenv("NTFY_SERVER"):
-                config["server"] = os.getenv("NTFY_SERVER")
-            if os.getenv("NTFY_TOPIC"):
-                config["topic"] = os.getenv("NTFY_TOPIC")
-            if os.getenv("NTFY_TOKEN"):
-                config["token"] = os.getenv("NTFY_TOKEN")
-        
-        elif channel_name == "feishu":
-            if os.getenv("FEISHU_WEBHOOK_URL"):
-                config["webhook_url"] = os.getenv("FEISHU_WEBHOOK_URL")
-            if os.getenv("FEISHU_MSG_TYPE"):
-                config["msg_type"] = os.getenv("FEISHU_MSG_TYPE")
-        
-        elif channel_name == "wework":
-            if os.getenv("WEWORK_WEBHOOK_URL"):
-                config["webhook_url"] = os.getenv("WEWORK_WEBHOOK_URL")
-            if os.getenv("WEWORK_MSG_TYPE"):
-                config["msg_type"] = os.getenv("WEWORK_MSG_TYPE")
-        
-        elif channel_name == "dingtalk":
-            if os.getenv("DINGTALK_WEBHOOK_URL"):
-                config["webhook_url"] = os.getenv("DINGTALK_WEBHOOK_URL")
-            if os.getenv("DINGTALK_MSG_TYPE"):
-                config["msg_type"] = os.getenv("DINGTALK_MSG_TYPE")
-        
-        elif channel_name == "gotify":
-            if os.getenv("GOTIFY_SERVER"):
-                config["server"] = os.getenv("GOTIFY_SERVER")
-            if os.getenv("GOTIFY_TOKEN"):
-                config["token"] = os.getenv("GOTIFY_TOKEN")
-            if os.getenv("GOTIFY_PRIORITY"):
-                config["priority"] = int(os.getenv("GOTIFY_PRIORITY"))
-            if os.getenv("GOTIFY_TITLE"):
-                config["title"] = os.getenv("GOTIFY_TITLE")
-        
+        config.update(self._channel_env_values(channel_name))
+
+        if channel_name == "telegram":
+            self._apply_env_proxy(config)
+
         return config
 
     def _create_channels_from_env_vars(self) -> List[NotificationChannel]:
         """从环境变量自动创建通知通道"""
         channels = []
-        
-        # PushPlus
-        if os.getenv("PUSHPLUS_TOKEN"):
-            channels.append(NotificationChannel(
-                name="pushplus",
-                enabled=True,
-                config={"token": os.getenv("PUSHPLUS_TOKEN")}
-            ))
-        
-        # Telegram
-        if os.getenv("TELEGRAM_BOT_TOKEN") and os.getenv("TELEGRAM_CHAT_ID"):
-            telegram_config = {
-                "bot_token": os.getenv("TELEGRAM_BOT_TOKEN"),
-                "chat_id": os.getenv("TELEGRAM_CHAT_ID")
-            }
-            # 添加代理配置
-            proxy_config = {}
-            if os.getenv("HTTP_PROXY"):
-                proxy_config["http"] = os.getenv("HTTP_PROXY")
-            if os.getenv("HTTPS_PROXY"):
-                proxy_config["https"] = os.getenv("HTTPS_PROXY")
-            if proxy_config:
-                telegram_config["proxy"] = proxy_config
-            
-            channels.append(NotificationChannel(
-                name="telegram",
-                enabled=True,
-                config=telegram_config
-            ))
-        
-        # WxPusher
-        if os.getenv("WXPUSHER_SPT"):
-            channels.append(NotificationChannel(
-                name="wxpusher",
-                enabled=True,
-                config={"spt": os.getenv("WXPUSHER_SPT")}
-            ))
-        
-        # Apprise
-        if os.getenv("APPRISE_URL"):
-            channels.append(NotificationChannel(
-                name="apprise",
-                enabled=True,
-                config={"url": os.getenv("APPRISE_URL")}
-            ))
-        
-        # Bark
-        if os.getenv("BARK_SERVER") and os.getenv("BARK_DEVICE_KEY"):
-            bark_config = {
-                "server": os.getenv("BARK_SERVER"),
-                "device_key": os.getenv("BARK_DEVICE_KEY")
-            }
-            if os.getenv("BARK_SOUND"):
-                bark_config["sound"] = os.getenv("BARK_SOUND")
-            
-            channels.append(NotificationChannel(
-                name="bark",
-                enabled=True,
-                config=bark_config
-            ))
-        
-        # Ntfy
-        if os.getenv("NTFY_SERVER") and os.getenv("NTFY_TOPIC"):
-            ntfy_config = {
-                "server": os.getenv("NTFY_SERVER"),
-                "topic": os.getenv("NTFY_TOPIC")
-            }
-            if os.getenv("NTFY_TOKEN"):
-                ntfy_config["token"] = os.getenv("NTFY_TOKEN")
-            
-            channels.append(NotificationChannel(
-                name="ntfy",
-                enabled=True,
-                config=ntfy_config
-            ))
-        
-        # 飞书
-        if os.getenv("FEISHU_WEBHOOK_URL"):
-            feishu_config = {
-                "webhook_url": os.getenv("FEISHU_WEBHOOK_URL")
-            }
-            if os.getenv("FEISHU_MSG_TYPE"):
-                feishu_config["msg_type"] = os.getenv("FEISHU_MSG_TYPE")
-            
-            channels.append(NotificationChannel(
-                name="feishu",
-                enabled=True,
-                config=feishu_config
-            ))
-        
-        # 企业微信
-        if os.getenv("WEWORK_WEBHOOK_URL"):
-            wework_config = {
-                "webhook_url": os.getenv("WEWORK_WEBHOOK_URL")
-            }
-            if os.getenv("WEWORK_MSG_TYPE"):
-                wework_config["msg_type"] = os.getenv("WEWORK_MSG_TYPE")
-            
-            channels.append(NotificationChannel(
-                name="wework",
-                enabled=True,
-                config=wework_config
-            ))
-        
-        # 钉钉
-        if os.getenv("DINGTALK_WEBHOOK_URL"):
-            dingtalk_config = {
-                "webhook_url": os.getenv("DINGTALK_WEBHOOK_URL")
-            }
-            if os.getenv("DINGTALK_MSG_TYPE"):
-                dingtalk_config["msg_type"] = os.getenv("DINGTALK_MSG_TYPE")
-            
-            channels.append(NotificationChannel(
-                name="dingtalk",
-                enabled=True,
-                config=dingtalk_config
-            ))
-        
-        # Gotify
-        if os.getenv("GOTIFY_SERVER") and os.getenv("GOTIFY_TOKEN"):
-            gotify_config = {
-                "server": os.getenv("GOTIFY_SERVER"),
-                "token": os.getenv("GOTIFY_TOKEN")
-            }
-            if os.getenv("GOTIFY_PRIORITY"):
-                gotify_config["priority"] = int(os.getenv("GOTIFY_PRIORITY"))
-            if os.getenv("GOTIFY_TITLE"):
-                gotify_config["title"] = os.getenv("GOTIFY_TITLE")
-            
+
+        for channel_name, env_fields in self.CHANNEL_ENV_MAP.items():
+            channel_config = self._channel_env_values(channel_name)
+            # 必需的配置项都设置了才创建通道
+            if not all(config_key in channel_config
+                       for config_key, _, required in env_fields if required):
+                continue
+
+            if channel_name == "telegram":
+                self._apply_env_proxy(channel_config)
+
             channels.append(NotificationChannel(
-                name="gotify",
+                name=channel_name,
                 enabled=True,
-                config=gotify_config
+                config=channel_config
             ))
-        
+
         if channels:
             logging.info(f"✅ 从环境变量自动创建了 {len(channels)} 个通知通道")
-        
+
         return channels
 
     def _load_user_configs(self, config_data: dict) -> List[UserConfig]:
@@ -947,8 +1063,9 @@ class ConfigManager:
         users = []
 
         # 从YAML配置加载
-        users_config = self._get_nested_dict_value(
-            config_data, "curl_config.users"
+        curl_data = config_data.get("curl_config")
+        users_config = (
+            curl_data.get("users") if isinstance(curl_data, dict) else None
         )
         if users_config and isinstance(users_config, list):
             for user_data in users_config:
@@ -971,8 +1088,9 @@ class RandomHelper:
     """随机数助手类"""
 
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def parse_range(range_str: str) -> Tuple[float, float]:
-        """解析范围字符串，如 "60-120" 或 "30" """
+        """解析范围字符串，如 "60-120" 或 "30"（结果会被缓存）"""
         if '-' in range_str:
             parts = range_str.split('-', 1)
             return float(parts[0]), float(parts[1])
@@ -995,6 +1113,11 @@ class RandomHelper:
 class CurlParser:
     """CURL命令解析器"""
 
+    # 一次扫描同时匹配 -H 'k: v'、-b 'cookie' 和 --data-raw 'json'
+    CURL_TOKEN_PATTERN = re.compile(
+        r"-H '([^:]+): ([^']+)'|-b '([^']+)'|--data-raw '([^']+)'"
+    )
+
     @staticmethod
     def parse_curl_command(curl_command: str) -> Tuple[
         Dict[str, str], Dict[str, str], Dict[str, Any]
@@ -1005,28 +1128,36 @@ class CurlParser:
         支持 --data-raw 'json' 方式的请求数据提取
         """
         headers_temp = {}
-
-        # 提取 headers
-        for match in re.findall(r"-H '([^:]+): ([^']+)'", curl_command):
-            headers_temp[match[0]] = match[1]
-
-        # 提取 cookies
-        cookies = {}
+        cookie_b = None
+        data_raw = None
+
+        for match in CurlParser.CURL_TOKEN_PATTERN.finditer(curl_command):
+            header_name, header_value, cookie_value, data_value = match.groups()
+            if header_name is not None:
+                # 提取 headers
+                headers_temp[header_name] = header_value
+            elif cookie_value is not None:
+                # 从 -b 'xxx' 提取（以第一个为准）
+                if cookie_b is None:
+                    cookie_b = cookie_value
+            elif data_raw is None:
+                data_raw = data_value
 
         # 从 -H 'Cookie: xxx' 提取
         cookie_header = next((v for k, v in headers_temp.items()
                              if k.lower() == 'cookie'), '')
-
-        # 从 -b 'xxx' 提取
-        cookie_b = re.search(r"-b '([^']+)'", curl_command)
-        cookie_string = cookie_b.group(1) if cookie_b else cookie_header
+        cookie_string = cookie_b if cookie_b is not None else cookie_header
 
         # 解析 cookie 字符串
+        cookies = {}
         if cookie_string:
-            for cookie in cookie_string.split('; '):
-                if '=' in cookie:
-                    key, value = cookie.split('=', 1)
-                    cookies[key.strip()] = value.strip()
+            cookies = dict(
+                (key.strip(), value.strip())
+                for key, value in (
+                    cookie.split('=', 1)
+                    for cookie in cookie_string.split('; ') if '=' in cookie
+                )
+            )
 
         # 移除 headers 中的 Cookie
         headers = {
@@ -1036,10 +1167,9 @@ class CurlParser:
 
         # 提取请求数据
         request_data = {}
-        data_match = re.search(r"--data-raw '([^']+)'", curl_command)
-        if data_match:
+        if data_raw is not None:
             try:
-                request_data = json.loads(data_match.group(1))
+                request_data = json_loads(data_raw)
                 logging.debug(f"✅ 从CURL命令提取到请求数据: {request_data}")
             except json.JSONDecodeError as e:
                 logging.warning(f"⚠️ 解析请求数据JSON失败: {e}")
@@ -1131,11 +1261,21 @@ class CurlParser:
 class HttpClient:
     """HTTP客户端封装"""
 
+    REQUEST_TIMES_MAXLEN = 1024
+    # 所有请求共用的固定请求头，设置在会话上，请求时只需传入CURL中的动态部分
+    BASE_HEADERS = {
+        "Accept": "application/json, text/plain, */*",
+        "Content-Type": "application/json;charset=UTF-8",
+        "Connection": "keep-alive",
+    }
+
     def __init__(self, config: NetworkConfig):
         self.config = config
         self.session = requests.Session()
         self._setup_session()
-        self.request_times = []
+        # 只保留最近的响应时间，长时间运行时内存占用保持恒定
+        self.request_times = deque(maxlen=self.REQUEST_TIMES_MAXLEN)
+        self._request_time_sum = 0.0
 
     def _setup_session(self):
         """设置HTTP会话"""
@@ -1146,50 +1286,91 @@ class HttpClient:
             backoff_factor=1
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # 同一主机反复请求，显式配置连接池以复用长连接
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=4,
+            pool_maxsize=max(16, self.config.rate_limit),
+            pool_block=False
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
+        self.session.headers.update(self.BASE_HEADERS)
 
         # 设置超时
         self.session.timeout = self.config.timeout
 
     def post_json(
-        self, url: str, data: dict, headers: dict, cookies: dict
+        self, url: str, data: dict, headers: Optional[dict] = None,
+        cookies: Optional[dict] = None
     ) -> Tuple[dict, float]:
-        """发送JSON POST请求"""
-        start_time = time.time()
+        """发送JSON POST请求
+
+        headers 只需包含本次请求特有的部分，固定部分由会话默认请求头提供。
+        """
+        start_time = time.perf_counter()
 
         try:
             response = self.session.post(
                 url,
-                data=json.dumps(data, separators=(',', ':')),
+                data=json_dumps(data),
                 headers=headers,
                 cookies=cookies,
                 timeout=self.config.timeout
             )
 
-            response_time = time.time() - start_time
-            self.request_times.append(response_time)
+            response_time = time.perf_counter() - start_time
+            self._record_request_time(response_time)
 
             response.raise_for_status()
-            return response.json(), response_time
+            return json_loads(response.content), response_time
 
         except Exception as e:
-            response_time = time.time() - start_time
-            self.request_times.append(response_time)
+            response_time = time.perf_counter() - start_time
+            self._record_request_time(response_time)
             raise e
 
+    async def post_json_async(
+        self, url: str, data: dict, headers: Optional[dict] = None,
+        cookies: Optional[dict] = None
+    ) -> Tuple[dict, float]:
+        """异步发送JSON POST请求
+
+        在线程池中执行阻塞请求，等待网络响应期间不阻塞事件循环。
+        """
+        return await asyncio.to_thread(
+            self.post_json, url, data, headers, cookies
+        )
+
+    def close(self):
+        """关闭HTTP会话，释放连接池"""
+        self.session.close()
+
+    async def __aenter__(self) -> "HttpClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _record_request_time(self, response_time: float):
+        """记录响应时间，同步维护滑动窗口内的总和"""
+        if len(self.request_times) == self.request_times.maxlen:
+            self._request_time_sum -= self.request_times[0]
+        self.request_times.append(response_time)
+        self._request_time_sum += response_time
+
     def get_average_response_time(self) -> float:
         """获取平均响应时间"""
         if self.request_times:
-            return sum(self.request_times) / len(self.request_times)
+            return self._request_time_sum / len(self.request_times)
         return 0.0
 
 
 class UserAgentRotator:
     """User-Agent轮换器"""
 
-    USER_AGENTS = [
+    # 不可变常量，避免运行时被意外修改
+    USER_AGENTS = (
         ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
          '(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'),
         ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
@@ -1201,8 +1382,8 @@ class UserAgentRotator:
          'Gecko/20100101 Firefox/132.0'),
         ('Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) '
          'AppleWebKit/605.1.15 (KHTML, like Gecko) Version/18.1.1 '
-         'Safari/605.1.15')
-    ]
+         'Safari/605.1.15'),
+    )
 
     @classmethod
     def get_random_user_agent(cls) -> str:
@@ -1222,11 +1403,28 @@ class SmartReadingManager:
         self.current_book_chapters = []
         self.current_chapter_index = 0
         self.last_book_switch_time = 0
-        
+
+        # 阅读模式在会话内不变，预先解析并绑定对应的选择方法
+        self._mode = ReadingMode(reading_config.mode)
+        self._mode_dispatch = {
+            ReadingMode.SMART_RANDOM: self._smart_random_position,
+            ReadingMode.SEQUENTIAL: self._sequential_position,
+            ReadingMode.PURE_RANDOM: self._pure_random_position,
+        }
+
         # 创建书籍ID到章节的映射（保持向后兼容）
         self.book_chapters_map = {
             book.book_id: book.chapters for book in reading_config.books
         }
+        # 书籍ID的有序列表及其位置索引，避免每次换书都重建列表并线性查找
+        self._book_ids = list(self.book_chapters_map)
+        self._book_pos = {
+            book_id: i for i, book_id in enumerate(self._book_ids)
+        }
+        # 日志中显示的书籍ID缩写，每本书只截取一次
+        self._short_ids = {
+            book_id: book_id[:10] for book_id in self._book_ids
+        }
         # 创建书籍ID到书名的映射
         self.book_names_map = {
             book.book_id: book.name for book in reading_config.books
@@ -1242,6 +1440,13 @@ class SmartReadingManager:
                 if chapter_info.chapter_index is not None:
                     self.chapter_index_map[chapter_info.chapter_id] = chapter_info.chapter_index
 
+    def short_book_id(self, book_id: str) -> str:
+        """获取用于日志显示的书籍ID缩写"""
+        short_id = self._short_ids.get(book_id)
+        if short_id is None:
+            short_id = self._short_ids[book_id] = book_id[:10]
+        return short_id
+
     def get_chapter_index(self, chapter_id: str, curl_ci: Optional[int] = None) -> Optional[int]:
         """
         获取章节索引，按照优先级：配置的索引值 > 自动计算的索引 > CURL提取的值
@@ -1270,14 +1475,15 @@ class SmartReadingManager:
     def set_curl_data(self, book_id: str, chapter_id: str):
         """设置从CURL提取的数据作为起点"""
         book_name = self.book_names_map.get(
-            book_id, f"未知书籍({book_id[:10]}...)"
+            book_id, f"未知书籍({self.short_book_id(book_id)}...)"
         )
         logging.info(f"🔍 尝试设置CURL数据: 书籍={book_name}, 章节={chapter_id}")
         
         # 显示已配置的书籍信息
-        if self.book_names_map:
+        if (self.book_names_map and
+                logging.getLogger().isEnabledFor(logging.INFO)):
             book_list = [
-                f"{name}({book_id[:10]}...)" 
+                f"{name}({self.short_book_id(book_id)}...)"
                 for book_id, name in self.book_names_map.items()
             ]
             logging.info(f"🔍 当前配置的书籍: {', '.join(book_list)}")
@@ -1342,8 +1548,11 @@ class SmartReadingManager:
 
     def _add_new_book_chapter(self, book_id: str, chapter_id: str) -> bool:
         """添加新的书籍-章节组合"""
-        book_name = f"动态书籍({book_id[:10]}...)"
+        book_name = f"动态书籍({self.short_book_id(book_id)}...)"
         self.book_chapters_map[book_id] = [chapter_id]
+        if book_id not in self._book_pos:
+            self._book_pos[book_id] = len(self._book_ids)
+            self._book_ids.append(book_id)
         self.book_names_map[book_id] = book_name
         self.current_book_id = book_id
         self.current_book_name = book_name
@@ -1361,7 +1570,7 @@ class SmartReadingManager:
     def _fallback_to_config(self) -> bool:
         """回退到配置数据"""
         if self.config.fallback_to_config and self.book_chapters_map:
-            first_book = list(self.book_chapters_map.keys())[0]
+            first_book = self._book_ids[0]
             first_book_name = self.book_names_map.get(first_book, "未知书籍")
             self._switch_to_book(first_book)
             logging.info(f"✅ 回退到配置数据: 书籍《{first_book_name}》")
@@ -1372,22 +1581,19 @@ class SmartReadingManager:
 
     def get_next_reading_position(self) -> Tuple[str, str]:
         """获取下一个阅读位置"""
-        mode = ReadingMode(self.config.mode)
-
-        if mode == ReadingMode.SMART_RANDOM:
-            return self._smart_random_position()
-        elif mode == ReadingMode.SEQUENTIAL:
-            return self._sequential_position()
-        else:  # PURE_RANDOM
-            return self._pure_random_position()
+        return self._mode_dispatch[self._mode]()
 
     def _smart_random_position(self) -> Tuple[str, str]:
         """智能随机选择位置"""
-        logging.debug(
-            f"🔍 智能随机模式 - 当前书籍: "
-            f"《{self.current_book_name}》({self.current_book_id[:10]}...), "
-            f"当前章节: {self.current_chapter_id}"
-        )
+        # 每次阅读都会调用，未开启DEBUG时跳过日志字符串的拼接
+        debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logging.debug(
+                f"🔍 智能随机模式 - 当前书籍: "
+                f"《{self.current_book_name}》"
+                f"({self.short_book_id(self.current_book_id)}...), "
+                f"当前章节: {self.current_chapter_id}"
+            )
 
         # 确保有有效的当前状态
         if not self.current_book_id or not self.current_book_chapters:
@@ -1406,12 +1612,10 @@ class SmartReadingManager:
         )
 
         if should_switch_book and len(self.book_chapters_map) > 1:
-            # 随机选择其他书籍
-            other_books = [
-                bid for bid in self.book_chapters_map.keys()
-                if bid != self.current_book_id
-            ]
-            new_book_id = random.choice(other_books)
+            # 随机选择其他书籍（拒绝采样，无需构建排除当前书籍的新列表）
+            new_book_id = random.choice(self._book_ids)
+            while new_book_id == self.current_book_id:
+                new_book_id = random.choice(self._book_ids)
             self._switch_to_book(new_book_id)
             self.last_book_switch_time = current_time
             new_book_name = self.book_names_map.get(new_book_id, "未知书籍")
@@ -1424,9 +1628,10 @@ class SmartReadingManager:
 
         if should_skip_chapter:
             # 随机选择当前书籍的其他章节
-            if len(self.current_book_chapters) > 1:
+            chapters_count = len(self.current_book_chapters)
+            if chapters_count > 1:
                 self.current_chapter_index = random.randint(
-                    0, len(self.current_book_chapters) - 1
+                    0, chapters_count - 1
                 )
                 self.current_chapter_id = self.current_book_chapters[
                     self.current_chapter_index
@@ -1442,10 +1647,11 @@ class SmartReadingManager:
             self._next_chapter()
 
         result = (self.current_book_id, self.current_chapter_id)
-        logging.debug(
-            f"🔍 智能随机选择结果: 书籍=《{self.current_book_name}》"
-            f"({result[0][:10]}...), 章节={result[1]}"
-        )
+        if debug_enabled:
+            logging.debug(
+                f"🔍 智能随机选择结果: 书籍=《{self.current_book_name}》"
+                f"({self.short_book_id(result[0])}...), 章节={result[1]}"
+            )
         return result
 
     def _sequential_position(self) -> Tuple[str, str]:
@@ -1456,7 +1662,7 @@ class SmartReadingManager:
     def _pure_random_position(self) -> Tuple[str, str]:
         """纯随机位置"""
         # 随机选择书籍
-        book_id = random.choice(list(self.book_chapters_map.keys()))
+        book_id = random.choice(self._book_ids)
         # 随机选择章节
         chapters = self.book_chapters_map[book_id]
         chapter_id = random.choice(chapters)
@@ -1487,12 +1693,11 @@ class SmartReadingManager:
 
         # 如果超出当前书籍章节范围，切换到下一本书
         if self.current_chapter_index >= len(self.current_book_chapters):
-            book_ids = list(self.book_chapters_map.keys())
-            current_book_index = book_ids.index(self.current_book_id)
+            current_book_index = self._book_pos[self.current_book_id]
 
             # 切换到下一本书，如果是最后一本则回到第一本
-            next_book_index = (current_book_index + 1) % len(book_ids)
-            next_book_id = book_ids[next_book_index]
+            next_book_index = (current_book_index + 1) % len(self._book_ids)
+            next_book_id = self._book_ids[next_book_index]
 
             self._switch_to_book(next_book_id)
             next_book_name = self.book_names_map.get(next_book_id, "未知书籍")
@@ -1544,33 +1749,94 @@ class HumanBehaviorSimulator:
 class NotificationService:
     """通知服务"""
 
+    WXPUSHER_URL = "https://wxpusher.zjiecode.com/api/send/message"
+    # 通知重试的指数退避参数（秒）
+    RETRY_BACKOFF_BASE = 1.0
+    RETRY_BACKOFF_CAP = 10.0
+
     def __init__(self, config: NotificationConfig):
         self.config = config
+        # 已初始化的Apprise对象，按URL缓存（None 表示URL无效）
+        self._apprise_objects: Dict[str, Any] = {}
+        # 各通道复用同一个会话，保持与通知服务器的长连接；
+        # 走代理的通道（Telegram）使用独立会话，仅在实际需要代理时创建
+        self._pool_size = max(4, sum(1 for c in config.channels if c.enabled))
+        self._notify_session = self._create_session(self._pool_size)
+        self._proxy_session: Optional[requests.Session] = None
+        self._proxy_session_lock = threading.Lock()
+
+    @staticmethod
+    def _create_session(pool_size: int) -> requests.Session:
+        """创建带连接池的通知会话"""
+        session = requests.Session()
+        # 重试统一由 _send_http_notification 负责，适配器层不再重试，避免重复推送
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            pool_block=True,
+            max_retries=0
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers["Connection"] = "keep-alive"
+        return session
+
+    def close(self):
+        """关闭通知会话，释放连接池"""
+        self._notify_session.close()
+        if self._proxy_session is not None:
+            self._proxy_session.close()
+
+    def _get_proxy_session(self) -> requests.Session:
+        """获取代理通道使用的会话，首次使用时创建"""
+        with self._proxy_session_lock:
+            if self._proxy_session is None:
+                self._proxy_session = self._create_session(self._pool_size)
+            return self._proxy_session
 
-    def send_notification(self, message: str) -> bool:
-        """发送通知"""
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _join_url(server: str, path: str) -> str:
+        """拼接通道服务地址，同一通道只计算一次"""
+        return f"{server.rstrip('/')}/{path}"
+
+    def __enter__(self) -> "NotificationService":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    async def send_notification_async(self, message: str) -> bool:
+        """并发发送通知到所有启用的通道"""
         if not self.config.enabled:
             return True
 
-        success_count = 0
-        total_channels = len([c for c in self.config.channels if c.enabled])
-
-        if total_channels == 0:
+        channels = [c for c in self.config.channels if c.enabled]
+        if not channels:
             logging.warning("⚠️ 没有启用的通知通道")
             return True
 
-        for channel in self.config.channels:
-            if channel.enabled:
-                try:
-                    if self._send_notification_to_channel(message, channel):
-                        success_count += 1
-                        logging.info(f"✅ 通道 {channel.name} 通知发送成功")
-                    else:
-                        logging.warning(f"⚠️ 通道 {channel.name} 通知发送失败")
-                except Exception as e:
-                    logging.error(f"❌ 通道 {channel.name} 通知发送异常: {e}")
+        results = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    self._send_notification_to_channel, message, channel
+                )
+                for channel in channels
+            ),
+            return_exceptions=True
+        )
+
+        success_count = 0
+        for channel, result in zip(channels, results):
+            if isinstance(result, Exception):
+                logging.error(f"❌ 通道 {channel.name} 通知发送异常: {result}")
+            elif result:
+                success_count += 1
+                logging.info(f"✅ 通道 {channel.name} 通知发送成功")
+            else:
+                logging.warning(f"⚠️ 通道 {channel.name} 通知发送失败")
 
-        logging.info(f"📊 通知发送完成: {success_count}/{total_channels} 个通道成功")
+        logging.info(f"📊 通知发送完成: {success_count}/{len(channels)} 个通道成功")
         return success_count > 0
 
     def _send_notification_to_channel(
@@ -1650,12 +1916,11 @@ class NotificationService:
             return False
 
         # 使用极简方式
-        url = (f"https://wxpusher.zjiecode.com/api/send/message/"
-               f"{config['spt']}/"
-               f"{urllib.parse.quote(message)}")
+        url = (f"{self._join_url(self.WXPUSHER_URL, config['spt'])}/"
+               f"{quote(message)}")
 
         try:
-            response = requests.get(url, timeout=10)
+            response = self._notify_session.get(url, timeout=10)
             response.raise_for_status()
             logging.info("✅ WxPusher通知发送成功")
             return True
@@ -1672,15 +1937,23 @@ class NotificationService:
         for attempt in range(max_retries):
             try:
                 if service_name == "Telegram":
-                    response = requests.post(
-                        url, json=data, proxies=proxies, timeout=30
+                    session = (
+                        self._get_proxy_session() if proxies
+                        else self._notify_session
+                    )
+                    response = session.post(
+                        url,
+                        data=json_dumps(data),
+                        headers={'Content-Type': 'application/json'},
+                        proxies=proxies,
+                        timeout=30
                     )
                 else:
                     # 使用自定义headers或默认headers
                     request_headers = headers if headers else {'Content-Type': 'application/json'}
-                    response = requests.post(
+                    response = self._notify_session.post(
                         url,
-                        data=json.dumps(data).encode('utf-8'),
+                        data=json_dumps(data),
                         headers=request_headers,
                         timeout=10
                     )
@@ -1695,7 +1968,11 @@ class NotificationService:
                     f"(尝试 {attempt + 1}/{max_retries}): {e}"
                 )
                 if attempt < max_retries - 1:
-                    time.sleep(random.randint(5, 15))
+                    delay = min(
+                        self.RETRY_BACKOFF_CAP,
+                        self.RETRY_BACKOFF_BASE * (2 ** attempt)
+                    ) + random.uniform(0, 1)
+                    time.sleep(delay)
 
         return False
 
@@ -1706,18 +1983,21 @@ class NotificationService:
             return False
 
         try:
-            # 尝试导入apprise库
-            try:
-                import apprise
-            except ImportError:
-                logging.error("❌ Apprise库未安装，请执行: pip install apprise")
-                return False
+            url = config["url"]
+            if url not in self._apprise_objects:
+                # 按需导入apprise库（较重，未使用该通道时不加载）
+                try:
+                    import apprise
+                except ImportError:
+                    logging.error("❌ Apprise库未安装，请执行: pip install apprise")
+                    return False
 
-            # 创建Apprise对象
-            apobj = apprise.Apprise()
+                # 创建Apprise对象并添加通知服务，URL只解析一次
+                apobj = apprise.Apprise()
+                self._apprise_objects[url] = apobj if apobj.add(url) else None
 
-            # 添加通知服务
-            if not apobj.add(config["url"]):
+            apobj = self._apprise_objects[url]
+            if apobj is None:
                 logging.error("❌ Apprise URL格式无效")
                 return False
 
@@ -1743,8 +2023,7 @@ class NotificationService:
             return False
 
         # 构建Bark URL
-        bark_url = (f"{config['server'].rstrip('/')}/"
-                    f"{config['device_key']}")
+        bark_url = self._join_url(config['server'], config['device_key'])
 
         # 准备数据
         data = {
@@ -1765,8 +2044,7 @@ class NotificationService:
             return False
 
         # 构建Ntfy URL
-        ntfy_url = (f"{config['server'].rstrip('/')}/"
-                    f"{config['topic']}")
+        ntfy_url = self._join_url(config['server'], config['topic'])
 
         try:
             # 准备请求头
@@ -1780,7 +2058,7 @@ class NotificationService:
                 headers["Authorization"] = f"Bearer {config['token']}"
 
             # 发送POST请求
-            response = requests.post(
+            response = self._notify_session.post(
                 ntfy_url,
                 data=message.encode('utf-8'),
                 headers=headers,
@@ -1942,60 +2220,133 @@ class NotificationService:
         return self._send_http_notification(url, data, "Gotify", headers=headers)
 
 
+class SessionIntervalController:
+    """守护进程会话间隔控制器
+
+    根据会话成功率的指数移动平均调整下一次会话间隔：成功率越低，等待越久，
+    在服务端频繁拒绝时自动退避。
+    """
+
+    EMA_ALPHA = 0.3
+
+    def __init__(self, config: DaemonConfig):
+        self.config = config
+        self.ema_success_rate = 1.0
+        range_min, range_max = RandomHelper.parse_range(config.session_interval)
+        self.min_interval = config.min_interval or range_min
+        self.max_interval = config.max_interval or range_max * 2
+
+    def record_session(self, sessions: List[ReadingSession]):
+        """记录一次会话的成功率"""
+        successful = sum(s.successful_reads for s in sessions)
+        total = successful + sum(s.failed_reads for s in sessions)
+        success_rate = successful / total if total else 0.0
+        self.ema_success_rate = (
+            self.EMA_ALPHA * success_rate +
+            (1 - self.EMA_ALPHA) * self.ema_success_rate
+        )
+
+    def next_interval_minutes(self) -> int:
+        """获取下一次会话的等待时间（分钟）"""
+        base_interval = RandomHelper.get_random_from_range(
+            self.config.session_interval
+        )
+        interval = base_interval * (2 - self.ema_success_rate)
+        return int(min(max(interval, self.min_interval), self.max_interval))
+
+
 class CronParser:
-    """Cron表达式解析器"""
+    """Cron表达式解析器
+
+    支持标准五段格式：分 时 日 月 周，每段可使用 *、数字、范围(a-b)、
+    步长(*/n、a-b/n) 以及逗号分隔的列表，例如 "0 9,18 * * 1-5"。
+    """
+
+    # (字段名, 最小值, 最大值)
+    FIELDS = (
+        ("分钟", 0, 59),
+        ("小时", 0, 23),
+        ("日期", 1, 31),
+        ("月份", 1, 12),
+        ("星期", 0, 7),
+    )
 
     @staticmethod
-    def parse_cron_to_schedule(cron_expression: str) -> bool:
-        """将cron表达式转换为schedule调度"""
-        # 简化的cron解析，支持基本格式：分 时 日 月 周
-        # 例如: "0 */2 * * *" 表示每2小时执行一次
+    def _parse_field(value: str, name: str, lo: int, hi: int) -> frozenset:
+        """解析单个cron字段为取值集合"""
+        values = set()
+        for part in value.split(","):
+            range_part, _, step_part = part.partition("/")
+            step = int(step_part) if step_part else 1
+            if step <= 0:
+                raise ValueError(f"{name}步长必须大于0: {part}")
+
+            if range_part == "*":
+                start, end = lo, hi
+            elif "-" in range_part:
+                start_str, end_str = range_part.split("-", 1)
+                start, end = int(start_str), int(end_str)
+            else:
+                start = int(range_part)
+                end = hi if step_part else start
+
+            if not lo <= start <= end <= hi:
+                raise ValueError(f"{name}超出范围 {lo}-{hi}: {part}")
+            values.update(range(start, end + 1, step))
+        return frozenset(values)
+
+    @classmethod
+    @functools.lru_cache(maxsize=16)
+    def parse(cls, cron_expression: str) -> tuple:
+        """解析cron表达式，返回各字段取值集合及日期/星期是否被限制"""
         parts = cron_expression.strip().split()
         if len(parts) != 5:
-            logging.error(f"❌ 无效的cron表达式: {cron_expression}")
-            return False
+            raise ValueError(f"无效的cron表达式: {cron_expression}")
 
-        minute, hour, day, month, weekday = parts
+        minutes, hours, days, months, weekdays = (
+            cls._parse_field(value, *spec)
+            for value, spec in zip(parts, cls.FIELDS)
+        )
+        # 周日既可以写作 0 也可以写作 7
+        if 7 in weekdays:
+            weekdays = (weekdays - {7}) | {0}
 
-        try:
-            # 处理每小时执行
-            if hour.startswith("*/"):
-                interval = int(hour[2:])
-                schedule.every(interval).hours.do(
-                    lambda: asyncio.create_task(
-                        WeReadApplication.run_single_session()
-                    )
-                )
-                logging.info(f"✅ 已设置定时任务: 每{interval}小时执行一次")
-                return True
+        return (
+            sorted(minutes), sorted(hours), days, months, weekdays,
+            not parts[2].startswith("*"), not parts[4].startswith("*")
+        )
 
-            # 处理固定时间执行
-            elif hour.isdigit() and minute.isdigit():
-                time_str = f"{hour.zfill(2)}:{minute.zfill(2)}"
-                schedule.every().day.at(time_str).do(
-                    lambda: asyncio.create_task(
-                        WeReadApplication.run_single_session()
-                    )
-                )
-                logging.info(f"✅ 已设置定时任务: 每天{time_str}执行")
-                return True
+    @classmethod
+    def next_fire(cls, cron_expression: str,
+                  after: Optional[datetime] = None) -> datetime:
+        """计算 after（默认当前时间）之后的下一次触发时间"""
+        (minutes, hours, days, months, weekdays,
+         days_restricted, weekdays_restricted) = cls.parse(cron_expression)
+
+        current = (after or datetime.now()).replace(second=0, microsecond=0)
+        current += timedelta(minutes=1)
+
+        # 最多向后查找约5年，覆盖 2月29日 这类低频日期
+        for _ in range(366 * 5):
+            weekday = current.isoweekday() % 7
+            if days_restricted and weekdays_restricted:
+                # 与标准cron一致：日期和星期同时限制时满足其一即可
+                day_matched = current.day in days or weekday in weekdays
+            else:
+                day_matched = current.day in days and weekday in weekdays
 
-            # 处理每天执行
-            elif hour == "*" and minute.isdigit():
-                schedule.every().hour.at(f":{minute.zfill(2)}").do(
-                    lambda: asyncio.create_task(
-                        WeReadApplication.run_single_session()
-                    )
-                )
-                logging.info(f"✅ 已设置定时任务: 每小时第{minute}分钟执行")
-                return True
+            if current.month in months and day_matched:
+                for hour in hours:
+                    if hour < current.hour:
+                        continue
+                    for minute in minutes:
+                        if hour == current.hour and minute < current.minute:
+                            continue
+                        return current.replace(hour=hour, minute=minute)
 
-        except Exception as e:
-            logging.error(f"❌ cron表达式解析失败: {e}")
-            return False
+            current = (current + timedelta(days=1)).replace(hour=0, minute=0)
 
-        logging.error(f"❌ 不支持的cron表达式格式: {cron_expression}")
-        return False
+        raise ValueError(f"cron表达式没有可触发的时间: {cron_expression}")
 
 
 class WeReadApplication:
@@ -2003,12 +2354,16 @@ class WeReadApplication:
 
     _instance = None
     _shutdown_requested = False
-    _current_session_manager = None
+    _shutdown_event: Optional[asyncio.Event] = None
+    _event_loop: Optional[asyncio.AbstractEventLoop] = None
+    _active_session_managers: set = set()
     _daily_session_count = 0
     _last_session_date = None
 
     def __init__(self, config: WeReadConfig):
         self.config = config
+        # 应用级通知服务，错误与总结通知共用，避免每次重新创建
+        self.notification_service = NotificationService(config.notification)
         WeReadApplication._instance = self
 
         # 设置信号处理
@@ -2027,30 +2382,65 @@ class WeReadApplication:
         if startup_mode == StartupMode.IMMEDIATE:
             # immediate模式下立即退出
             logging.info(f"📡 收到信号 {signum}，立即退出")
-            import sys
             sys.exit(0)
         else:
             # 其他模式优雅关闭
             logging.info(f"📡 收到信号 {signum}，准备优雅关闭...")
             WeReadApplication._shutdown_requested = True
+            # 唤醒正在等待的协程（信号处理器不在事件循环回调中执行）
+            if WeReadApplication._event_loop and WeReadApplication._shutdown_event:
+                WeReadApplication._event_loop.call_soon_threadsafe(
+                    WeReadApplication._shutdown_event.set
+                )
 
             # 如果当前有会话在运行，尝试等待其完成
-            if WeReadApplication._current_session_manager:
-                logging.info("⏳ 等待当前阅读会话完成...")
+            active_count = len(WeReadApplication._active_session_managers)
+            if active_count:
+                logging.info(f"⏳ 等待 {active_count} 个阅读会话完成...")
                 # 这里可以添加更复杂的会话中断逻辑
 
+    @classmethod
+    def _enter_session(cls, session_manager):
+        """登记正在运行的会话管理器"""
+        cls._active_session_managers.add(session_manager)
+
+    @classmethod
+    def _exit_session(cls, session_manager):
+        """注销会话管理器"""
+        cls._active_session_managers.discard(session_manager)
+
+    @classmethod
+    async def _wait_for_shutdown(cls, timeout: float) -> bool:
+        """等待关闭信号，收到信号返回 True，超时返回 False"""
+        if cls._shutdown_requested:
+            return True
+        try:
+            await asyncio.wait_for(cls._shutdown_event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
     async def run(self):
         """根据配置的启动模式运行应用程序"""
         startup_mode = StartupMode(self.config.startup_mode.lower())
 
-        if startup_mode == StartupMode.IMMEDIATE:
-            await self._run_immediate_mode()
-        elif startup_mode == StartupMode.SCHEDULED:
-            await self._run_scheduled_mode()
-        elif startup_mode == StartupMode.DAEMON:
-            await self._run_daemon_mode()
-        else:
-            raise ValueError(f"未知的启动模式: {self.config.startup_mode}")
+        # 关闭事件需在运行中的事件循环内创建
+        WeReadApplication._event_loop = asyncio.get_running_loop()
+        WeReadApplication._shutdown_event = asyncio.Event()
+        if WeReadApplication._shutdown_requested:
+            WeReadApplication._shutdown_event.set()
+
+        try:
+            if startup_mode == StartupMode.IMMEDIATE:
+                await self._run_immediate_mode()
+            elif startup_mode == StartupMode.SCHEDULED:
+                await self._run_scheduled_mode()
+            elif startup_mode == StartupMode.DAEMON:
+                await self._run_daemon_mode()
+            else:
+                raise ValueError(f"未知的启动模式: {self.config.startup_mode}")
+        finally:
+            self.notification_service.close()
 
     async def _run_immediate_mode(self):
         """立即执行模式"""
@@ -2065,19 +2455,24 @@ class WeReadApplication:
             logging.error("❌ 定时模式已启用，但schedule配置未启用")
             return
 
-        # 解析cron表达式并设置调度
-        if not CronParser.parse_cron_to_schedule(
-            self.config.schedule.cron_expression
-        ):
-            logging.error("❌ 定时任务设置失败")
+        cron_expression = self.config.schedule.cron_expression
+        try:
+            next_run = CronParser.next_fire(cron_expression)
+        except ValueError as e:
+            logging.error(f"❌ 定时任务设置失败: {e}")
             return
 
-        logging.info("⏰ 定时任务已启动，等待执行时间...")
+        logging.info(f"⏰ 定时任务已启动 ({cron_expression})，等待执行时间...")
 
-        # 运行调度器
+        # 直接睡到下一次触发时间，期间可被关闭信号唤醒
         while not WeReadApplication._shutdown_requested:
-            schedule.run_pending()
-            await asyncio.sleep(1)
+            logging.info(f"⏰ 下次执行时间: {next_run:%Y-%m-%d %H:%M}")
+            delay = (next_run - datetime.now()).total_seconds()
+            if await self._wait_for_shutdown(max(delay, 0)):
+                break
+
+            await self.run_single_session()
+            next_run = CronParser.next_fire(cron_expression)
 
         logging.info("👋 定时任务已停止")
 
@@ -2089,6 +2484,8 @@ class WeReadApplication:
             logging.error("❌ 守护进程模式已启用，但daemon配置未启用")
             return
 
+        interval_controller = SessionIntervalController(self.config.daemon)
+
         while not WeReadApplication._shutdown_requested:
             # 检查每日会话限制
             current_date = datetime.now().date()
@@ -2108,28 +2505,28 @@ class WeReadApplication:
 
             # 执行阅读会话
             try:
-                await self.run_single_session()
+                session_stats = await self.run_single_session()
                 WeReadApplication._daily_session_count += 1
+                interval_controller.record_session(session_stats)
 
                 # 如果没有请求关闭，等待下一次会话
                 if not WeReadApplication._shutdown_requested:
-                    interval_minutes = RandomHelper.get_random_int_from_range(
-                        self.config.daemon.session_interval
+                    interval_minutes = (
+                        interval_controller.next_interval_minutes()
                     )
                     logging.info(
-                        f"😴 守护进程等待 {interval_minutes} 分钟后执行下一次会话..."
+                        f"😴 守护进程等待 {interval_minutes} 分钟后执行下一次会话"
+                        f"（成功率均值 "
+                        f"{interval_controller.ema_success_rate * 100:.1f}%）..."
                     )
 
-                    # 分段等待，以便能够响应关闭信号
-                    for _ in range(interval_minutes * 60):
-                        if WeReadApplication._shutdown_requested:
-                            break
-                        await asyncio.sleep(1)
+                    # 等待期间可被关闭信号唤醒
+                    await self._wait_for_shutdown(interval_minutes * 60)
 
             except Exception as e:
                 logging.error(f"❌ 守护进程会话执行失败: {e}")
                 # 等待一段时间后重试
-                await asyncio.sleep(300)  # 5分钟后重试
+                await self._wait_for_shutdown(300)  # 5分钟后重试
 
         logging.info("👋 守护进程已停止")
 
@@ -2142,33 +2539,33 @@ class WeReadApplication:
 
         logging.info(f"⏰ 等待到明天 00:00，剩余 {wait_seconds/3600:.1f} 小时")
 
-        # 分段等待，以便能够响应关闭信号
-        for _ in range(int(wait_seconds)):
-            if WeReadApplication._shutdown_requested:
-                break
-            await asyncio.sleep(1)
+        # 等待期间可被关闭信号唤醒
+        await self._wait_for_shutdown(wait_seconds)
 
     @classmethod
-    async def run_single_session(cls):
-        """执行单次阅读会话"""
+    async def run_single_session(cls) -> List[ReadingSession]:
+        """执行单次阅读会话，返回成功完成的会话统计"""
         instance = cls.get_instance()
         if not instance:
             logging.error("❌ 应用程序实例未初始化")
-            return
+            return []
 
         # 检查是否配置了多用户模式
         if instance.config.users:
-            await cls._run_multi_user_sessions(instance)
-        else:
-            await cls._run_single_user_session(instance)
+            return await cls._run_multi_user_sessions(instance)
+        return await cls._run_single_user_session(instance)
 
     @classmethod
-    async def _run_single_user_session(cls, instance):
+    async def _run_single_user_session(cls, instance) -> List[ReadingSession]:
         """执行单用户会话"""
+        session_manager = None
         try:
             # 创建会话管理器
-            session_manager = WeReadSessionManager(instance.config)
-            WeReadApplication._current_session_manager = session_manager
+            session_manager = WeReadSessionManager(
+                instance.config,
+                notification_service=instance.notification_service
+            )
+            cls._enter_session(session_manager)
 
             # 执行阅读会话
             session_stats = await session_manager.start_reading_session()
@@ -2176,6 +2573,7 @@ class WeReadApplication:
             # 输出统计信息
             logging.info("📊 会话统计:")
             logging.info(session_stats.get_statistics_summary())
+            return [session_stats]
 
         except Exception as e:
             error_msg = f"❌ 阅读会话执行失败: {e}"
@@ -2183,99 +2581,139 @@ class WeReadApplication:
 
             # 发送错误通知
             try:
-                notification_service = NotificationService(
-                    instance.config.notification
+                await instance.notification_service.send_notification_async(
+                    error_msg
                 )
-                notification_service.send_notification(error_msg)
             except Exception:
                 pass
         finally:
-            WeReadApplication._current_session_manager = None
+            if session_manager:
+                cls._exit_session(session_manager)
+                session_manager.close()
+
+        return []
 
     @classmethod
-    async def _run_multi_user_sessions(cls, instance):
+    async def _run_multi_user_sessions(cls, instance) -> List[ReadingSession]:
         """执行多用户会话"""
         logging.info(f"🎭 检测到多用户配置，共 {len(instance.config.users)} 个用户")
 
         all_session_stats = []
         successful_users = []
         failed_users = []
+        # 用户错误默认先缓存，在总结时合并为一条通知发送
+        user_errors: List[Tuple[str, str]] = []
+        semaphore = asyncio.Semaphore(max(1, instance.config.max_concurrent_users))
+
+        # 用户启动偏移逐个累加 30-60 秒，并发时各用户依次错开启动
+        start_offsets = [0]
+        for _ in instance.config.users[1:]:
+            start_offsets.append(
+                start_offsets[-1]
+                + RandomHelper.get_random_int_from_range("30-60")
+            )
 
-        for user_config in instance.config.users:
-            if WeReadApplication._shutdown_requested:
-                logging.info("📡 收到关闭信号，停止多用户会话")
-                break
-
-            try:
-                logging.info(f"👤 开始执行用户 {user_config.name} 的阅读会话")
-
-                # 创建用户特定的会话管理器
-                session_manager = WeReadSessionManager(
-                    instance.config, user_config
+        async def _run_one(
+            index: int, user_config: UserConfig
+        ) -> Optional[ReadingSession]:
+            # 用户间隔延迟（错开启动，避免同时请求）；等待期间不占用并发名额
+            if index > 0:
+                logging.info(
+                    f"⏳ 用户 {user_config.name} 延迟 {start_offsets[index]} 秒后启动..."
                 )
-                WeReadApplication._current_session_manager = session_manager
+                if await cls._wait_for_shutdown(start_offsets[index]):
+                    logging.info(
+                        f"📡 收到关闭信号，跳过用户 {user_config.name} 的阅读会话"
+                    )
+                    return None
 
-                # 执行阅读会话
-                session_stats = await session_manager.start_reading_session()
-                all_session_stats.append((user_config.name, session_stats))
-                successful_users.append(user_config.name)
+            async with semaphore:
+                if WeReadApplication._shutdown_requested:
+                    logging.info(
+                        f"📡 收到关闭信号，跳过用户 {user_config.name} 的阅读会话"
+                    )
+                    return None
 
-                # 输出单个用户的统计信息
-                logging.info(f"📊 用户 {user_config.name} 会话统计:")
-                logging.info(session_stats.get_statistics_summary())
+                session_manager = None
+                try:
+                    logging.info(f"👤 开始执行用户 {user_config.name} 的阅读会话")
 
-                # 用户间隔延迟（避免同时请求）
-                if len(instance.config.users) > 1:
-                    user_interval = RandomHelper.get_random_int_from_range(
-                        "30-60"
-                    )
-                    logging.info(
-                        f"⏳ 用户间隔延迟 {user_interval} 秒..."
+                    # 创建用户特定的会话管理器
+                    session_manager = WeReadSessionManager(
+                        instance.config, user_config,
+                        notification_service=instance.notification_service
                     )
-                    await asyncio.sleep(user_interval)
+                    cls._enter_session(session_manager)
 
-            except Exception as e:
-                error_msg = (
-                    f"❌ 用户 {user_config.name} 阅读会话执行失败: {e}"
-                )
-                logging.error(error_msg)
-                failed_users.append(user_config.name)
+                    # 执行阅读会话
+                    session_stats = await session_manager.start_reading_session()
 
-                # 发送单个用户的错误通知
-                try:
-                    notification_service = NotificationService(
-                        instance.config.notification
+                    # 输出单个用户的统计信息
+                    logging.info(f"📊 用户 {user_config.name} 会话统计:")
+                    logging.info(session_stats.get_statistics_summary())
+                    return session_stats
+
+                except Exception as e:
+                    error_msg = (
+                        f"❌ 用户 {user_config.name} 阅读会话执行失败: {e}"
                     )
-                    notification_service.send_notification(error_msg)
-                except Exception:
-                    pass
-            finally:
-                WeReadApplication._current_session_manager = None
+                    logging.error(error_msg)
+
+                    if instance.config.notification.send_per_user_errors:
+                        # 发送单个用户的错误通知
+                        try:
+                            await instance.notification_service.send_notification_async(
+                                error_msg
+                            )
+                        except Exception:
+                            pass
+                    else:
+                        user_errors.append((user_config.name, error_msg))
+                    raise
+                finally:
+                    if session_manager:
+                        cls._exit_session(session_manager)
+                        session_manager.close()
+
+        results = await asyncio.gather(
+            *(
+                _run_one(index, user_config)
+                for index, user_config in enumerate(instance.config.users)
+            ),
+            return_exceptions=True
+        )
+
+        for user_config, result in zip(instance.config.users, results):
+            if isinstance(result, ReadingSession):
+                all_session_stats.append((user_config.name, result))
+                successful_users.append(user_config.name)
+            elif isinstance(result, BaseException):
+                failed_users.append(user_config.name)
 
         # 生成多用户会话总结
-        cls._generate_multi_user_summary(
-            instance, all_session_stats, successful_users, failed_users
+        await cls._generate_multi_user_summary(
+            instance, all_session_stats, successful_users, failed_users,
+            user_errors
         )
 
+        return [stats for _, stats in all_session_stats]
+
     @classmethod
-    def _generate_multi_user_summary(
-        cls, instance, all_session_stats, successful_users, failed_users
+    async def _generate_multi_user_summary(
+        cls, instance, all_session_stats, successful_users, failed_users,
+        user_errors: Optional[List[Tuple[str, str]]] = None
     ):
-        """生成多用户会话总结"""
+        """生成多用户会话总结，并合并发送缓存的用户错误"""
         total_users = len(instance.config.users)
         successful_count = len(successful_users)
         failed_count = len(failed_users)
 
-        # 计算总体统计
-        total_duration = sum(
-            stats.actual_duration_seconds for _, stats in all_session_stats
-        )
-        total_reads = sum(
-            stats.successful_reads for _, stats in all_session_stats
-        )
-        total_failed_reads = sum(
-            stats.failed_reads for _, stats in all_session_stats
-        )
+        # 计算总体统计（单次遍历累计）
+        total_duration = total_reads = total_failed_reads = 0
+        for _, stats in all_session_stats:
+            total_duration += stats.actual_duration_seconds
+            total_reads += stats.successful_reads
+            total_failed_reads += stats.failed_reads
 
         summary = f"""🎭 多用户阅读会话总结
 
@@ -2297,14 +2735,22 @@ class WeReadApplication:
         logging.info("📊 多用户会话总结:")
         logging.info(summary)
 
+        # 合并后的通知：失败详情在前，统计总结在后
+        message_parts = []
+        if user_errors:
+            error_lines = "\n".join(
+                f"  👤 {name}: {error_msg}" for name, error_msg in user_errors
+            )
+            message_parts.append(f"⚠️ 失败详情:\n{error_lines}")
+        if instance.config.notification.include_statistics:
+            message_parts.append(summary)
+
         # 发送总结通知
-        if (instance.config.notification.enabled and
-                instance.config.notification.include_statistics):
+        if instance.config.notification.enabled and message_parts:
             try:
-                notification_service = NotificationService(
-                    instance.config.notification
+                await instance.notification_service.send_notification_async(
+                    "\n\n".join(message_parts)
                 )
-                notification_service.send_notification(summary)
             except Exception as e:
                 logging.error(f"❌ 多用户总结通知发送失败: {e}")
 
@@ -2314,10 +2760,23 @@ class WeReadSessionManager:
 
     # 微信读书API常量
     KEY = "3c5c8717f3daf09iop3423zafeqoi"
+    KEY_BYTES = KEY.encode('ascii')
     COOKIE_DATA = {"rq": "%2Fweb%2Fbook%2Fread"}
+    # 固定不变的请求体，类加载时序列化一次
+    COOKIE_BODY = json_dumps(COOKIE_DATA)
+    FIX_SYNCKEY_BODY = json_dumps({"bookIds": ["3300060341"]})
     READ_URL = "https://weread.qq.com/web/book/read"
     RENEW_URL = "https://weread.qq.com/web/login/renewal"
     FIX_SYNCKEY_URL = "https://weread.qq.com/web/book/chapterInfos"
+    # _calculate_hash 中奇数位字符的移位量序列
+    HASH_SHIFTS = tuple(range(1, 30, 2))
+    # 从 Set-Cookie 响应头中提取 wr_skey 的值
+    WR_SKEY_PATTERN = re.compile(r'wr_skey=([^;,\s]*)')
+    # 用户 reading_overrides 可覆盖的阅读配置字段
+    READING_OVERRIDE_KEYS = frozenset({
+        "mode", "target_duration", "reading_interval",
+        "use_curl_data_first", "fallback_to_config",
+    })
 
     # 默认请求数据
     DEFAULT_DATA = {
@@ -2338,7 +2797,8 @@ class WeReadSessionManager:
         "s": "36cc0815"  # 校验和或哈希值
     }
 
-    def __init__(self, config: WeReadConfig, user_config: UserConfig = None):
+    def __init__(self, config: WeReadConfig, user_config: UserConfig = None,
+                 notification_service: Optional[NotificationService] = None):
         self.config = config
         self.user_config = user_config
         self.user_name = user_config.name if user_config else "default"
@@ -2349,7 +2809,17 @@ class WeReadSessionManager:
         )
 
         self.http_client = HttpClient(config.network)
-        self.notification_service = NotificationService(config.notification)
+        # Cookie刷新和synckey修复专用的长连接会话；不保存响应中的Cookie，
+        # 请求中只携带由 self.cookies 管理的Cookie
+        self._renew_session = requests.Session()
+        self._renew_session.cookies.set_policy(
+            http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+        )
+        # 优先复用应用级通知服务，仅自行创建的实例由本会话负责关闭
+        self._owns_notification_service = notification_service is None
+        self.notification_service = (
+            notification_service or NotificationService(config.notification)
+        )
         self.behavior_simulator = HumanBehaviorSimulator(
             config.human_simulation
         )
@@ -2362,6 +2832,11 @@ class WeReadSessionManager:
         self.cookies = {}
         self.data = self.DEFAULT_DATA.copy()
         self.session_user_agent = None  # 会话级别的User-Agent
+        # _encode_data 的缓存：排序后的键及各字段上一次的编码结果
+        self._encode_keys: List[str] = []
+        self._encode_key_set: set = set()
+        self._encode_exclude: Optional[str] = None
+        self._encoded_pairs: Dict[str, Tuple[str, str]] = {}
 
         self._load_curl_config()
         self._initialize_session_user_agent()
@@ -2373,26 +2848,12 @@ class WeReadSessionManager:
         if not user_config or not user_config.reading_overrides:
             return base_config
 
-        # 创建基础配置的副本
-        from dataclasses import replace
-        effective_config = replace(base_config)
-
-        # 应用覆盖配置
+        # 仅允许覆盖白名单内的字段，一次性生成副本
         overrides = user_config.reading_overrides
-        if "mode" in overrides:
-            effective_config.mode = overrides["mode"]
-        if "target_duration" in overrides:
-            effective_config.target_duration = overrides["target_duration"]
-        if "reading_interval" in overrides:
-            effective_config.reading_interval = overrides["reading_interval"]
-        if "use_curl_data_first" in overrides:
-            effective_config.use_curl_data_first = overrides[
-                "use_curl_data_first"
-            ]
-        if "fallback_to_config" in overrides:
-            effective_config.fallback_to_config = overrides[
-                "fallback_to_config"
-            ]
+        effective_config = replace(base_config, **{
+            key: overrides[key]
+            for key in overrides.keys() & self.READING_OVERRIDE_KEYS
+        })
 
         logging.info(
             f"📋 用户 {user_config.name} 应用配置覆盖: "
@@ -2559,12 +3020,17 @@ class WeReadSessionManager:
         self.user_ps = ps_value
         self.user_pc = pc_value
         self.user_app_id = app_id
+        # 预先截取日志中使用的缩写，阅读循环内无需重复切片
+        self._ps_short = ps_value[:10]
+        self._pc_short = pc_value[:10]
 
     def _initialize_session_user_agent(self):
         """初始化会话级别的User-Agent"""
         if (self.config.human_simulation.enabled and
                 self.config.human_simulation.rotate_user_agent):
             self.session_user_agent = UserAgentRotator.get_random_user_agent()
+            # 会话内 User-Agent 固定不变，初始化时写入请求头一次即可
+            self.headers['user-agent'] = self.session_user_agent
             logging.info(
                 f"🔄 用户 {self.user_name} 会话User-Agent已设置: "
                 f"{self.session_user_agent[:50]}..."
@@ -2599,7 +3065,7 @@ class WeReadSessionManager:
         logging.info(f"🎯 本次目标阅读时长: {target_minutes} 分钟")
 
         # 刷新cookie
-        if not self._refresh_cookie():
+        if not await self._refresh_cookie():
             raise Exception("Cookie刷新失败，程序终止")
 
         # 开始阅读循环
@@ -2654,7 +3120,7 @@ class WeReadSessionManager:
                     self.session_stats.failed_reads += 1
 
                 # 记录响应时间
-                self.session_stats.response_times.append(response_time)
+                self.session_stats.record_response(response_time)
 
                 # 获取下次阅读间隔
                 interval = self.behavior_simulator.get_reading_interval(
@@ -2670,11 +3136,19 @@ class WeReadSessionManager:
         # 完成会话
         self.session_stats.end_time = datetime.now()
         logging.info("🎉 阅读任务完成！")
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            stats = self.session_stats
+            logging.debug(
+                f"⏱️ 响应时间: 平均 {stats.average_response_time:.2f}秒, "
+                f"标准差 {stats.response_time_stddev:.2f}秒, "
+                f"P95 {stats.response_time_p95:.2f}秒, "
+                f"最大 {stats.max_response_time:.2f}秒"
+            )
 
         # 发送通知
         if (self.config.notification.enabled and
                 self.config.notification.include_statistics):
-            self.notification_service.send_notification(
+            await self.notification_service.send_notification_async(
                 self.session_stats.get_statistics_summary()
             )
 
@@ -2683,8 +3157,7 @@ class WeReadSessionManager:
     async def _simulate_reading_request(self,
                                         last_time: int) -> Tuple[bool, float]:
         """模拟阅读请求"""
-        # 准备请求数据
-        self.data.pop('s', None)
+        debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
 
         # 使用智能阅读管理器获取下一个阅读位置
         book_id, chapter_id = self.reading_manager.get_next_reading_position()
@@ -2695,21 +3168,17 @@ class WeReadSessionManager:
         chapter_ci = self.reading_manager.current_chapter_ci
         if chapter_ci is not None:
             self.data['ci'] = chapter_ci
-            logging.debug(
-                f"🔢 设置章节索引: ci={chapter_ci} (章节: {chapter_id})"
-            )
+            if debug_enabled:
+                logging.debug(
+                    f"🔢 设置章节索引: ci={chapter_ci} (章节: {chapter_id})"
+                )
 
         # 记录阅读内容
-        if book_id not in self.session_stats.books_read:
-            self.session_stats.books_read.append(book_id)
-            # 记录书名
-            book_name = self.reading_manager.book_names_map.get(
-                book_id, f"未知书籍({book_id[:10]}...)"
-            )
-            if book_name not in self.session_stats.books_read_names:
-                self.session_stats.books_read_names.append(book_name)
-        if chapter_id not in self.session_stats.chapters_read:
-            self.session_stats.chapters_read.append(chapter_id)
+        book_name = (
+            self.reading_manager.book_names_map.get(book_id)
+            or f"未知书籍({self.reading_manager.short_book_id(book_id)}...)"
+        )
+        self.session_stats.add_read(book_id, book_name, chapter_id)
 
         # 确保用户身份标识符的正确性（关键修复）
         if hasattr(self, 'user_ps') and hasattr(self, 'user_pc'):
@@ -2717,12 +3186,14 @@ class WeReadSessionManager:
             self.data['pc'] = self.user_pc
             if hasattr(self, 'user_app_id'):
                 self.data['appId'] = self.user_app_id
-            
-            logging.debug(
-                f"🔒 用户 {self.user_name} 身份确认: ps={self.user_ps[:10]}..., "
-                f"pc={self.user_pc[:10]}..., book={book_id[:10]}..., "
-                f"chapter={chapter_id[:10]}..."
-            )
+
+            if debug_enabled:
+                logging.debug(
+                    f"🔒 用户 {self.user_name} 身份确认: ps={self._ps_short}..., "
+                    f"pc={self._pc_short}..., "
+                    f"book={self.reading_manager.short_book_id(book_id)}..., "
+                    f"chapter={chapter_id[:10]}..."
+                )
 
         # 更新时间戳
         current_time = int(time.time())
@@ -2730,37 +3201,35 @@ class WeReadSessionManager:
         self.data['rt'] = current_time - last_time
         self.data['ts'] = int(current_time * 1000) + random.randint(0, 1000)
         self.data['rn'] = random.randint(0, 1000)
-        signature_string = (
-            f"{self.data['ts']}{self.data['rn']}{self.KEY}"
-        )
-        self.data['sg'] = hashlib.sha256(
-            signature_string.encode()
+        self.data['sg'] = _sha256(
+            b"%d%d" % (self.data['ts'], self.data['rn']) + self.KEY_BYTES
         ).hexdigest()
-        self.data['s'] = self._calculate_hash(self._encode_data(self.data))
-
-        # 使用会话级别的User-Agent（如果启用轮换）
-        if (self.config.human_simulation.enabled and
-                self.config.human_simulation.rotate_user_agent and
-                self.session_user_agent):
-            self.headers['user-agent'] = self.session_user_agent
+        # 校验和 s 基于除自身外的全部字段计算，直接覆盖旧值，无需先移除
+        self.data['s'] = self._calculate_hash(
+            self._encode_data(self.data, exclude='s')
+        )
 
         try:
             # 发送请求
-            response_data, response_time = self.http_client.post_json(
-                self.READ_URL, self.data, self.headers, self.cookies
+            response_data, response_time = (
+                await self.http_client.post_json_async(
+                    self.READ_URL, self.data, self.headers, self.cookies
+                )
             )
 
-            logging.debug(f"📕 响应数据: {response_data}")
+            if debug_enabled:
+                logging.debug(f"📕 响应数据: {response_data}")
 
             if 'succ' in response_data:
                 if 'synckey' in response_data:
-                    logging.debug(f"✅ 请求成功: {response_data}")
+                    if debug_enabled:
+                        logging.debug(f"✅ 请求成功: {response_data}")
                     return True, response_time
                 else:
                     logging.warning(
                         f"❌ 无synckey，尝试修复... 响应: {response_data}"
                     )
-                    self._fix_no_synckey()
+                    await self._fix_no_synckey()
                     return False, response_time
             else:
                 logging.warning(
@@ -2770,101 +3239,153 @@ class WeReadSessionManager:
                     f"🔍 失败的请求数据: book_id={self.data.get('b')}, "
                     f"chapter_id={self.data.get('c')}"
                 )
-                self._refresh_cookie()
+                await self._refresh_cookie()
                 return False, response_time
 
         except Exception as e:
             logging.error(f"❌ 请求失败: {e}")
             return False, 0.0
 
-    def _refresh_cookie(self) -> bool:
+    def close(self):
+        """释放会话持有的网络资源"""
+        self.http_client.close()
+        self._renew_session.close()
+        if self._owns_notification_service:
+            self.notification_service.close()
+
+    async def _refresh_cookie(self) -> bool:
         """刷新cookie"""
         logging.info("🍪 刷新cookie...")
 
         try:
-            response = requests.post(
+            # 在线程池中执行阻塞请求，不阻塞其他用户的阅读会话
+            response = await asyncio.to_thread(
+                self._renew_session.post,
                 self.RENEW_URL,
                 headers=self.headers,
                 cookies=self.cookies,
-                data=json.dumps(self.COOKIE_DATA, separators=(',', ':')),
+                data=self.COOKIE_BODY,
                 timeout=30
             )
 
-            for cookie in response.headers.get('Set-Cookie', '').split(';'):
-                if "wr_skey" in cookie:
-                    new_skey = cookie.split('=')[-1][:8]
+            match = self.WR_SKEY_PATTERN.search(
+                response.headers.get('Set-Cookie', '')
+            )
+            if match:
+                new_skey = match.group(1)[:8]
 
-                    if not new_skey:
-                        logging.error(f"❌ Cookie刷新失败，新密钥为空")
-                        return False
-                    
-                    self.cookies['wr_skey'] = new_skey
-                    logging.info(f"✅ Cookie刷新成功，新密钥: {new_skey}")
-                    return True
+                if not new_skey:
+                    logging.error(f"❌ Cookie刷新失败，新密钥为空")
+                    return False
+
+                self.cookies['wr_skey'] = new_skey
+                logging.info(f"✅ Cookie刷新成功，新密钥: {new_skey}")
+                return True
 
         except Exception as e:
             logging.error(f"❌ Cookie刷新失败: {e}")
 
         return False
 
-    def _fix_no_synckey(self):
+    async def _fix_no_synckey(self):
         """修复synckey问题
 
         代码引用: https://github.com/findmover/wxread
         """
         try:
-            requests.post(
+            await asyncio.to_thread(
+                self._renew_session.post,
                 self.FIX_SYNCKEY_URL,
                 headers=self.headers,
                 cookies=self.cookies,
-                data=json.dumps(
-                    {"bookIds": ["3300060341"]}, separators=(',', ':')
-                ),
+                data=self.FIX_SYNCKEY_BODY,
                 timeout=30
             )
         except Exception as e:
             logging.error(f"❌ 修复synckey失败: {e}")
 
-    @staticmethod
-    def _encode_data(data: dict) -> str:
+    def _encode_data(self, data: dict, exclude: Optional[str] = None) -> str:
         """数据编码
 
         代码引用: https://github.com/findmover/wxread
+
+        请求数据的键在会话内基本不变，排序结果只在键集合变化时重新计算；
+        大部分字段的值也不变，值未变化时复用上一次的编码结果。
+        exclude 指定的键不参与编码（用于计算校验和 s 时跳过其自身）。
         """
-        encoded_pairs = [
-            f"{k}={urllib.parse.quote(str(data[k]), safe='')}"
-            for k in sorted(data.keys())
-        ]
-        return '&'.join(encoded_pairs)
+        if (data.keys() != self._encode_key_set
+                or exclude != self._encode_exclude):
+            self._encode_key_set = set(data)
+            self._encode_exclude = exclude
+            self._encode_keys = sorted(
+                key for key in self._encode_key_set if key != exclude
+            )
+
+        encoded_pairs = self._encoded_pairs
+        parts = []
+        for key in self._encode_keys:
+            text = str(data[key])
+            cached = encoded_pairs.get(key)
+            if cached is None or cached[0] != text:
+                cached = encoded_pairs[key] = (
+                    text, f"{key}={quote(text, safe='')}"
+                )
+            parts.append(cached[1])
+        return '&'.join(parts)
 
     @staticmethod
     def _calculate_hash(input_string: str) -> str:
         """计算哈希值
-        
+
         代码引用: https://github.com/findmover/wxread
+
+        原算法从末尾每次取两个字符，分别左移后异或进两个累加器并截断为31位。
+        截断对异或满足分配律，可以先异或全部移位结果再统一截断，
+        循环交给 functools.reduce / map 在C层完成，结果与逐字符计算一致。
         """
         _7032f5 = 0x15051505
         _cc1055 = _7032f5
         length = len(input_string)
-        _19094e = length - 1
 
-        while _19094e > 0:
-            char_code = ord(input_string[_19094e])
-            shift_amount = (length - _19094e) % 30
-            _7032f5 = 0x7fffffff & (_7032f5 ^ char_code << shift_amount)
-
-            prev_char_code = ord(input_string[_19094e - 1])
-            prev_shift_amount = _19094e % 30
-            _cc1055 = 0x7fffffff & (
-                _cc1055 ^ prev_char_code << prev_shift_amount
+        if length > 1:
+            char_codes = list(map(ord, input_string))
+            # 第k次迭代的移位量分别为 (2k+1) % 30 和 (length-1-2k) % 30，周期为15
+            prev_shifts = [(length - 1 - 2 * k) % 30 for k in range(15)]
+            _7032f5 = 0x7fffffff & functools.reduce(
+                operator.xor,
+                map(operator.lshift, char_codes[length - 1:0:-2],
+                    itertools.cycle(WeReadSessionManager.HASH_SHIFTS)),
+                _7032f5
+            )
+            _cc1055 = 0x7fffffff & functools.reduce(
+                operator.xor,
+                map(operator.lshift, char_codes[length - 2::-2],
+                    itertools.cycle(prev_shifts)),
+                _cc1055
             )
-            _19094e -= 2
 
         return hex(_7032f5 + _cc1055)[2:].lower()
 
 
+# 异步日志的后台监听器（重新配置日志时需要先停止旧的监听器）
+_log_listener: Optional[QueueListener] = None
+
+
+def _stop_log_listener():
+    """停止异步日志监听器，并写出队列中剩余的日志"""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+atexit.register(_stop_log_listener)
+
+
 def setup_logging(logging_config: LoggingConfig = None, verbose: bool = False):
     """设置日志"""
+    global _log_listener
+
     if logging_config is None:
         logging_config = LoggingConfig()
 
@@ -2936,6 +3457,20 @@ def setup_logging(logging_config: LoggingConfig = None, verbose: bool = False):
         handlers.append(file_handler)
         print(f"警告: 日志轮转设置失败，使用普通文件处理器: {e}")
 
+    _stop_log_listener()
+
+    # 异步模式：调用方只负责入队，由后台线程完成控制台输出和磁盘写入
+    if logging_config.use_async_handler:
+        log_queue = queue.SimpleQueue()
+        _log_listener = QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        _log_listener.start()
+        queue_handler = QueueHandler(log_queue)
+        # 入队时只合并消息参数，完整格式由实际输出的处理器负责
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+        handlers = [queue_handler]
+
     # 配置根日志记录器
     logging.basicConfig(
         level=log_level,
@@ -3083,6 +3618,7 @@ async def main():
     """主函数"""
     # 解析命令行参数
     args = parse_arguments()
+    config_manager = None
 
     try:
         # 加载配置
@@ -3113,15 +3649,14 @@ async def main():
         error_msg = f"❌ 程序运行错误: {e}"
         logging.error(error_msg)
 
-        # 尝试发送错误通知
+        # 尝试发送错误通知（配置已加载时直接复用，避免重复解析）
         try:
-            config_manager = ConfigManager(
-                args.config if 'args' in locals() else "config.yaml"
-            )
-            notification_service = NotificationService(
+            if config_manager is None:
+                config_manager = ConfigManager(args.config)
+            with NotificationService(
                 config_manager.config.notification
-            )
-            notification_service.send_notification(error_msg)
+            ) as notification_service:
+                await notification_service.send_notification_async(error_msg)
         except Exception:
             pass
 
@@ -3134,11 +3669,6 @@ if __name__ == "__main__":
     except ImportError:
         missing_deps.append("PyYAML")
 
-    try:
-        import schedule  # noqa: F401,F811
-    except ImportError:
-        missing_deps.append("schedule")
-
     if missing_deps:
         print(f"❌ 缺少依赖: {', '.join(missing_deps)}")
         print("请安装: pip install -r requirements.txt")